@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY and my-bucketname are
+# dummy values, please replace them with original values.
+
+from datetime import timedelta
+
+from minio import Minio
+
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+# List uploads started more than a day ago.
+for upload in client.list_incomplete_uploads('my-bucketname',
+                                             older_than=timedelta(days=1)):
+    print(upload.object_name, upload.upload_id, upload.initiated_time)
+
+# Abort uploads started more than a week ago.
+part_count = 0
+size = 0
+for upload in client.abort_incomplete_uploads('my-bucketname',
+                                              older_than=timedelta(days=7),
+                                              num_workers=8):
+    part_count += upload.part_count
+    size += upload.size
+print('reclaimed', part_count, 'parts', size, 'bytes')
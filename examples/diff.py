@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY, my-bucketname and
+# my-replica-bucketname are dummy values, please replace them with original
+# values.
+
+from minio import Minio
+from minio.diff import ADDED, CHANGED, REMOVED, diff, list_local_objects
+
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+# Find objects to copy to and remove from replica bucket.
+for entry in diff(
+        client.list_objects('my-replica-bucketname', recursive=True),
+        client.list_objects('my-bucketname', recursive=True),
+):
+    if entry.kind in (ADDED, CHANGED):
+        print('copy', entry.object_name)
+    elif entry.kind == REMOVED:
+        print('remove', entry.object_name)
+
+# Compare local directory with objects under a prefix by size.
+for entry in diff(
+        client.list_objects('my-bucketname', 'photos/', recursive=True),
+        list_local_objects('/data/photos', prefix='photos/'),
+):
+    print(entry.kind, entry.object_name)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY, my-bucketname and
+# my-objectname are dummy values, please replace them with original values.
+
+from minio import Minio
+from minio.cache import ContentCache
+
+# Keep up to 1GiB of object data in local directory.
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY',
+               content_cache=ContentCache('/tmp/minio-cache',
+                                          max_size=1024*1024*1024))
+
+for _ in range(10):
+    # Object data is downloaded only if it is changed; otherwise server
+    # replies 304 (Not Modified) and cached file is reused.
+    path = client.get_cached_object('my-bucketname', 'my-objectname')
+    with open(path, 'rb') as data:
+        print(len(data.read()))
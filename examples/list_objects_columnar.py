@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY and my-bucketname are
+# dummy values, please replace them with original values.
+
+from minio import Minio
+
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+# Count objects and sum their sizes page by page.
+count = 0
+total_size = 0
+for batch in client.list_objects_columnar('my-bucketname', recursive=True):
+    count += len(batch['object_name'])
+    total_size += sum(size for size in batch['size'] if size is not None)
+print(count, total_size)
+
+# Fetch NumPy structured arrays; requires numpy package.
+for batch in client.list_objects_columnar('my-bucketname', recursive=True,
+                                          as_numpy=True):
+    print(batch['object_name'][batch['size'] > 1024 * 1024])
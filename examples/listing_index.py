@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY and my-bucketname are
+# dummy values, please replace them with original values.
+
+from datetime import datetime, timedelta, timezone
+
+from minio import Minio
+from minio.listindex import ListingIndex
+
+client = Minio('play.min.io',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+# Build local index of the bucket once.
+index = ListingIndex(client, 'my-bucketname', '/tmp/my-bucketname.db')
+print('indexed', index.rescan(), 'objects')
+
+# Query objects locally.
+since = datetime.now(timezone.utc) - timedelta(days=1)
+for obj in index.query(prefix='logs/', modified_after=since, min_size=1024):
+    print(obj.object_name, obj.size, obj.last_modified)
+
+# Keep the index fresh from bucket notifications.
+for record in index.listen():
+    print(record['eventName'], record['s3']['object']['key'])
@@ -35,3 +35,26 @@ with open('my-record-file', 'w') as record_data:
         record_data.write(d)
     # Get the stats
     print(data.stats())
+
+# Get parsed records; a CSV record is a tuple of fields.
+data = client.select_object_content('my-bucket', 'my-object', request)
+for record in data.records():
+    print(record)
+
+# Get records in batches of columns.
+data = client.select_object_content('my-bucket', 'my-object', request)
+for columns in data.record_batches(batch_size=10000, columnar=True):
+    print(len(columns[0]))
+
+
+# Print progress and cancel the query if it scans more than 1GiB.
+def progress(event_type, info):
+    print(event_type, info)
+    if int(info['BytesScanned']) > 1024*1024*1024:
+        raise ValueError('query scans too many bytes')
+
+
+data = client.select_object_content('my-bucket', 'my-object', request,
+                                    progress=progress)
+for record in data.records():
+    print(record)
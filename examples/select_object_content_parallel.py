@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY, my-bucketname and
+# my-objectname are dummy values, please replace them with original values.
+
+from minio import Minio
+from minio.selectrequest import (CSVInputSerialization, CSVOutputSerialization,
+                                 SelectRequest)
+
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+request = SelectRequest(
+    "select * from s3object where s._3 > 100",
+    CSVInputSerialization(),
+    CSVOutputSerialization(),
+)
+
+# Query 256MiB scan ranges of the object by 8 concurrent requests.
+data = client.select_object_content_parallel(
+    'my-bucketname', 'my-objectname', request,
+    num_workers=8, part_size=256*1024*1024,
+)
+try:
+    for record in data.records():
+        print(record)
+    print(data.stats())
+finally:
+    data.close()
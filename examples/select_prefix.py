@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY and my-bucketname are dummy
+# values, please replace them with original values.
+
+from minio import Minio
+from minio.selectrequest import (FILE_HEADER_INFO_USE, CSVInputSerialization,
+                                 CSVOutputSerialization, SelectRequest)
+
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY')
+
+request = SelectRequest(
+    "select s.city, s.amount from s3object s where s.amount > '100'",
+    CSVInputSerialization(file_header_info=FILE_HEADER_INFO_USE),
+    CSVOutputSerialization(),
+)
+
+# Query every CSV object of the partition by 16 concurrent requests.
+data = client.select_prefix(
+    'my-bucketname', 'sales/year=2020/', request,
+    suffix='.csv', num_workers=16,
+)
+try:
+    for object_name, record in data.keyed_records():
+        print(object_name, record)
+    print(data.stats())
+finally:
+    data.close()
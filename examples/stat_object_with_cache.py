@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Note: YOUR-ACCESSKEYID, YOUR-SECRETACCESSKEY, my-bucketname and
+# my-objectname are dummy values, please replace them with original values.
+
+from minio import Minio
+from minio.cache import StatCache
+
+# Cache stat_object() results for 30 seconds; revalidate expired entries
+# with a conditional request using cached ETag.
+client = Minio('s3.amazonaws.com',
+               access_key='YOUR-ACCESSKEYID',
+               secret_key='YOUR-SECRETACCESSKEY',
+               stat_cache=StatCache(ttl=30, max_entries=10000,
+                                    revalidate=True))
+
+for _ in range(10):
+    # Only first call sends HEAD request.
+    result = client.stat_object('my-bucketname', 'my-objectname')
+    print(result.etag, result.size)
@@ -29,6 +29,8 @@ This module implements the API.
 
 from __future__ import absolute_import
 
+import functools
+import importlib.util
 import itertools
 import json
 import os
@@ -44,26 +46,32 @@ from urllib3._collections import HTTPHeaderDict
 
 from . import __title__, __version__
 from . import time
+from .cache import ContentCache, RegionCache, StatCache
 from .commonconfig import Tags
 from .credentials import StaticProvider
-from .datatypes import (CompleteMultipartUploadResult, ListAllMyBucketsResult,
-                        ListMultipartUploadsResult, ListPartsResult, Object,
-                        Part, parse_list_objects)
-from .deleteobjects import DeleteError, DeleteRequest, DeleteResult
-from .error import InvalidResponseError, S3Error, ServerError
+from .datatypes import (AbortedUpload, CompleteMultipartUploadResult,
+                        ListAllMyBucketsResult, ListMultipartUploadsResult,
+                        ListObjectsResult, ListPartsResult, Object, Part,
+                        PrefixUsage, StatObjectResult, columns_to_numpy)
+from .deleteobjects import (DeleteError, DeleteObject, DeleteRequest,
+                            DeleteResult)
+from .error import InvalidResponseError, MinioException, S3Error, ServerError
 from .helpers import (BaseURL, ObjectWriteResult, ThreadPool,
                       check_bucket_name, check_non_empty_string, check_sse,
                       check_ssec, get_part_info, headers_to_strings,
-                      is_valid_policy_type, makedirs, md5sum_hash,
-                      normalize_headers, quote, read_part_data, sha256_hash)
+                      is_valid_policy_type, iterate_parallel, makedirs,
+                      md5sum_hash, normalize_headers, quote, read_part_data,
+                      sha256_hash)
 from .legalhold import LegalHold
 from .lifecycleconfig import LifecycleConfig
 from .notificationconfig import NotificationConfig
 from .objectlockconfig import ObjectLockConfig
 from .replicationconfig import ReplicationConfig
 from .retention import Retention
-from .select import SelectObjectReader
-from .selectrequest import SelectRequest
+from .select import MultiSelectReader, SelectObjectReader
+from .selectrequest import (COMPRESSION_TYPE_NONE, JSON_TYPE_LINES,
+                            CSVInputSerialization, JSONInputSerialization,
+                            SelectRequest)
 from .signer import (SIGN_V4_ALGORITHM, get_credential_string,
                      post_presign_v4, presign_v4, sign_v4_s3)
 from .sse import SseCustomerKey
@@ -84,6 +92,21 @@ _DEFAULT_USER_AGENT = "MinIO ({os}; {arch}) {lib}/{ver}".format(
 )
 
 
+def _delete_batches(delete_object_list):
+    """Split delete objects into lists of 1000 entries or whatever left."""
+    # turn list like objects into an iterator.
+    delete_object_list = itertools.chain(delete_object_list)
+    while True:
+        objects = [
+            delete_object for _, delete_object in zip(
+                range(1000), delete_object_list,
+            )
+        ]
+        if not objects:
+            break
+        yield objects
+
+
 class Minio:  # pylint: disable=too-many-public-methods
     """
     Simple Storage Service (aka S3) client to perform bucket and object
@@ -98,6 +121,12 @@ class Minio:  # pylint: disable=too-many-public-methods
     :param region: Region name of buckets in S3 service.
     :param http_client: Customized HTTP client.
     :param credentials: Credentials provider of your account in S3 service.
+    :param region_cache: :class:`RegionCache <RegionCache>` object to cache
+        regions of buckets.
+    :param stat_cache: :class:`StatCache <StatCache>` object to cache
+        stat_object() results.
+    :param content_cache: :class:`ContentCache <ContentCache>` object used
+        by get_cached_object().
     :return: :class:`Minio <Minio>` object
 
     Example::
@@ -121,7 +150,10 @@ class Minio:  # pylint: disable=too-many-public-methods
                  secure=True,
                  region=None,
                  http_client=None,
-                 credentials=None):
+                 credentials=None,
+                 region_cache=None,
+                 stat_cache=None,
+                 content_cache=None):
         # Validate http client has correct base class.
         if http_client and not isinstance(
                 http_client,
@@ -131,7 +163,17 @@ class Minio:  # pylint: disable=too-many-public-methods
                 "`urllib3.poolmanager.PoolManager`"
             )
 
-        self._region_map = dict()
+        if region_cache and not isinstance(region_cache, RegionCache):
+            raise ValueError("region cache must be RegionCache type")
+
+        if stat_cache and not isinstance(stat_cache, StatCache):
+            raise ValueError("stat cache must be StatCache type")
+        if content_cache and not isinstance(content_cache, ContentCache):
+            raise ValueError("content cache must be ContentCache type")
+
+        self._region_cache = region_cache or RegionCache()
+        self._stat_cache = stat_cache
+        self._content_cache = content_cache
         self._base_url = BaseURL(
             ("https://" if secure else "http://") + endpoint,
             region,
@@ -174,7 +216,7 @@ class Minio:  # pylint: disable=too-many-public-methods
 
         if (
                 retry and region and method == "HEAD" and bucket_name and
-                self._region_map.get(bucket_name)
+                self._region_cache.get(bucket_name)
         ):
             code, message = ("RetryHead", None)
 
@@ -219,6 +261,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=None,
             query_params=None,
             preload_content=True,
+            allow_not_modified=False,
     ):
         """Execute HTTP request."""
         creds = self._provider.retrieve() if self._provider else None
@@ -283,7 +326,9 @@ class Minio:  # pylint: disable=too-many-public-methods
             )
             self._trace_stream.write("\n")
 
-        if response.status in [200, 204, 206]:
+        if response.status in [200, 204, 206] or (
+                allow_not_modified and response.status == 304
+        ):
             if self._trace_stream:
                 self._trace_stream.write("----------END-HTTP----------\n")
             return response
@@ -377,8 +422,11 @@ class Minio:  # pylint: disable=too-many-public-methods
                 object_name=object_name,
             )
 
-        if response_error.code in ["NoSuchBucket", "RetryHead"]:
-            self._region_map.pop(bucket_name, None)
+        if (
+                bucket_name and
+                response_error.code in ["NoSuchBucket", "RetryHead"]
+        ):
+            self._region_cache.pop(bucket_name)
 
         raise response_error
 
@@ -391,8 +439,12 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=None,
             query_params=None,
             preload_content=True,
+            allow_not_modified=False,
     ):
-        """Execute HTTP request."""
+        """
+        Execute HTTP request. Response of status 304 (Not Modified) is
+        returned only if allow_not_modified is set; else it is an error.
+        """
         region = self._get_region(bucket_name, None)
 
         try:
@@ -405,6 +457,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 headers=headers,
                 query_params=query_params,
                 preload_content=preload_content,
+                allow_not_modified=allow_not_modified,
             )
         except S3Error as exc:
             if exc.code != "RetryHead":
@@ -421,6 +474,7 @@ class Minio:  # pylint: disable=too-many-public-methods
                 headers=headers,
                 query_params=query_params,
                 preload_content=preload_content,
+                allow_not_modified=allow_not_modified,
             )
         except S3Error as exc:
             if exc.code != "RetryHead":
@@ -454,11 +508,10 @@ class Minio:  # pylint: disable=too-many-public-methods
         if not bucket_name or not self._provider:
             return "us-east-1"
 
-        region = self._region_map.get(bucket_name)
-        if region:
-            return region
+        return self._region_cache.get(bucket_name, self._get_bucket_location)
 
-        # Execute GetBucketLocation REST API to get region of the bucket.
+    def _get_bucket_location(self, bucket_name):
+        """Execute GetBucketLocation S3 API."""
         response = self._url_open(
             "GET",
             "us-east-1",
@@ -468,14 +521,10 @@ class Minio:  # pylint: disable=too-many-public-methods
 
         element = ET.fromstring(response.data.decode())
         if not element.text:
-            region = "us-east-1"
-        elif element.text == "EU":
-            region = "eu-west-1"
-        else:
-            region = element.text
-
-        self._region_map[bucket_name] = region
-        return region
+            return "us-east-1"
+        if element.text == "EU":
+            return "eu-west-1"
+        return element.text
 
     def set_app_info(self, app_name, app_version):
         """
@@ -535,13 +584,17 @@ class Minio:  # pylint: disable=too-many-public-methods
         """Disables virtual style endpoint."""
         self._base_url.virtual_style_flag = False
 
-    def select_object_content(self, bucket_name, object_name, request):
+    def select_object_content(self, bucket_name, object_name, request,
+                              progress=None):
         """
         Select content of an object by SQL expression.
 
         :param bucket_name: Name of the bucket.
         :param object_name: Object name in the bucket.
         :param request: :class:`SelectRequest <SelectRequest>` object.
+        :param progress: A callable called with event type and parsed
+                         information of each Progress and Stats message;
+                         raise an exception from it to cancel the query.
         :return: A reader contains requested records and progress information.
 
         Example::
@@ -552,6 +605,14 @@ class Minio:  # pylint: disable=too-many-public-methods
                 request_progress=True,
             )
             data = client.select_object_content('foo', 'test.csv', request)
+
+            # Cancel the query if it scans more than 1GiB.
+            def progress(event_type, info):
+                if int(info["BytesScanned"]) > 1024*1024*1024:
+                    raise ValueError("query scans too many bytes")
+            data = client.select_object_content(
+                'foo', 'test.csv', request, progress=progress,
+            )
         """
         check_bucket_name(bucket_name)
         check_non_empty_string(object_name)
@@ -567,7 +628,168 @@ class Minio:  # pylint: disable=too-many-public-methods
             query_params={"select": "", "select-type": "2"},
             preload_content=False,
         )
-        return SelectObjectReader(response)
+        return SelectObjectReader(
+            response, request.output_serialization, progress,
+        )
+
+    def select_object_content_parallel(self, bucket_name, object_name,
+                                       request, num_workers=4,
+                                       part_size=64*1024*1024, ordered=True,
+                                       progress=None):
+        """
+        Select content of an object by SQL expression by splitting the object
+        into scan ranges of part_size queried concurrently. Scan range is
+        supported only for uncompressed CSV input without quoted record
+        delimiters and for JSON lines input.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Object name in the bucket.
+        :param request: :class:`SelectRequest <SelectRequest>` object without
+                        scan range.
+        :param num_workers: Number of concurrent select requests.
+        :param part_size: Size of each scan range in bytes.
+        :param ordered: Flag to yield records in object order.
+        :param progress: A callable called with event type and information
+                         summed over scan ranges of each Progress and Stats
+                         message.
+        :return: :class:`MultiSelectReader <MultiSelectReader>` object keyed
+                 by inclusive scan range (start, end); an empty object is
+                 queried by one request without scan range keyed by None.
+
+        Example::
+            request = SelectRequest(
+                "select * from s3object",
+                CSVInputSerialization(),
+                CSVOutputSerialization(),
+            )
+            data = client.select_object_content_parallel(
+                'foo', 'test.csv', request, num_workers=8,
+            )
+            for record in data.records():
+                print(record)
+        """
+        check_bucket_name(bucket_name)
+        check_non_empty_string(object_name)
+        if not isinstance(request, SelectRequest):
+            raise ValueError("request must be SelectRequest type")
+        if (
+                request.scan_start_range is not None or
+                request.scan_end_range is not None
+        ):
+            raise ValueError("request must not have scan range")
+        serialization = request.input_serialization
+        if (
+                not isinstance(
+                    serialization,
+                    (CSVInputSerialization, JSONInputSerialization),
+                ) or
+                serialization.compression_type not in (
+                    None, COMPRESSION_TYPE_NONE,
+                ) or
+                (isinstance(serialization, JSONInputSerialization) and
+                 serialization.json_type != JSON_TYPE_LINES)
+        ):
+            raise ValueError(
+                "scan range is supported only for uncompressed CSV and "
+                "JSON lines input",
+            )
+        if part_size < 1:
+            raise ValueError("part size must be greater than zero")
+        if num_workers < 1:
+            raise ValueError("number of workers must be at least 1")
+
+        size = self.stat_object(bucket_name, object_name).size
+
+        def _opener(start, end):
+            return lambda callback: self.select_object_content(
+                bucket_name,
+                object_name,
+                SelectRequest(
+                    request.expression,
+                    request.input_serialization,
+                    request.output_serialization,
+                    request_progress=request.request_progress,
+                    scan_start_range=start,
+                    scan_end_range=end,
+                ),
+                progress=callback,
+            )
+
+        openers = [
+            ((start, end), _opener(start, end))
+            for start, end in (
+                (start, min(start + part_size, size) - 1)
+                for start in range(0, size, part_size)
+            )
+        ]
+        if not openers:
+            # Empty object has no scan range; query it as a whole so that
+            # its stats are reported.
+            openers = [(None, lambda callback: self.select_object_content(
+                bucket_name, object_name, request, progress=callback,
+            ))]
+        return MultiSelectReader(
+            openers,
+            num_workers=num_workers,
+            ordered=ordered,
+            progress=progress,
+        )
+
+    def select_prefix(self, bucket_name, prefix, request, suffix=None,
+                      num_workers=8, ordered=False, progress=None):
+        """
+        Select content of every object under a prefix by the same SQL
+        expression with up to num_workers concurrent requests. Objects are
+        listed recursively and lazily as requests finish.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Select objects whose names start with prefix.
+        :param request: :class:`SelectRequest <SelectRequest>` object.
+        :param suffix: Select only objects whose names end with suffix.
+        :param num_workers: Number of concurrent select requests.
+        :param ordered: Flag to yield records in object name order.
+        :param progress: A callable called with event type and information
+                         summed over objects of each Progress and Stats
+                         message.
+        :return: :class:`MultiSelectReader <MultiSelectReader>` object keyed
+                 by object name.
+
+        Example::
+            request = SelectRequest(
+                "select * from s3object",
+                CSVInputSerialization(),
+                CSVOutputSerialization(),
+            )
+            data = client.select_prefix(
+                'foo', 'year=2020/', request, suffix='.csv',
+            )
+            for object_name, record in data.keyed_records():
+                print(object_name, record)
+            print(data.stats())
+        """
+        check_bucket_name(bucket_name)
+        if not isinstance(request, SelectRequest):
+            raise ValueError("request must be SelectRequest type")
+        if num_workers < 1:
+            raise ValueError("number of workers must be at least 1")
+
+        def _opener(object_name):
+            return lambda callback: self.select_object_content(
+                bucket_name, object_name, request, progress=callback,
+            )
+
+        objects = self.list_objects(bucket_name, prefix, recursive=True)
+        return MultiSelectReader(
+            (
+                (obj.object_name, _opener(obj.object_name))
+                for obj in objects
+                if not obj.is_dir and
+                obj.object_name.endswith(suffix or "")
+            ),
+            num_workers=num_workers,
+            ordered=ordered,
+            progress=progress,
+        )
 
     def make_bucket(self, bucket_name, location=None, object_lock=False):
         """
@@ -610,7 +832,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             body=body,
             headers=headers,
         )
-        self._region_map[bucket_name] = location
+        self._region_cache.set(bucket_name, location)
 
     def list_buckets(self):
         """
@@ -662,7 +884,7 @@ class Minio:  # pylint: disable=too-many-public-methods
         """
         check_bucket_name(bucket_name)
         self._execute("DELETE", bucket_name)
-        self._region_map.pop(bucket_name, None)
+        self._region_cache.pop(bucket_name)
 
     def get_bucket_policy(self, bucket_name):
         """
@@ -998,6 +1220,9 @@ class Minio:  # pylint: disable=too-many-public-methods
         # Create top level directory if needed.
         makedirs(os.path.dirname(file_path))
 
+        # Resuming a partial file relies on ETag and size of the object, so
+        # they are always fetched from the server instead of the stat cache.
+        self._invalidate_stat(bucket_name, object_name)
         stat = self.stat_object(
             bucket_name,
             object_name,
@@ -1018,6 +1243,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             os.remove(tmp_file_path)
             offset = 0
 
+        response = None
         try:
             response = self.get_object(
                 bucket_name,
@@ -1042,12 +1268,17 @@ class Minio:  # pylint: disable=too-many-public-methods
 
     def get_object(self, bucket_name, object_name, offset=0, length=0,
                    request_headers=None, ssec=None, version_id=None,
-                   extra_query_params=None):
+                   extra_query_params=None, match_etag=None,
+                   not_match_etag=None, modified_since=None,
+                   unmodified_since=None):
         """
         Get data of an object. Returned response should be closed after use to
         release network resources. To reuse the connection, it's required to
         call `response.release_conn()` explicitly.
 
+        If not_match_etag or modified_since condition is not met, response of
+        status 304 (Not Modified) without data is returned.
+
         :param bucket_name: Name of the bucket.
         :param object_name: Object name in the bucket.
         :param offset: Start byte position of object data.
@@ -1057,6 +1288,12 @@ class Minio:  # pylint: disable=too-many-public-methods
         :param ssec: Server-side encryption customer key.
         :param version_id: Version-ID of the object.
         :param extra_query_params: Extra query parameters for advanced usage.
+        :param match_etag: Get only if ETag of the object matches.
+        :param not_match_etag: Get only if ETag of the object does not match.
+        :param modified_since: Get only if the object is modified since this
+                               datetime.
+        :param unmodified_since: Get only if the object is not modified since
+                                 this datetime.
         :return: :class:`urllib3.response.HTTPResponse` object.
 
         Example::
@@ -1075,6 +1312,15 @@ class Minio:  # pylint: disable=too-many-public-methods
             finally:
                 response.close()
                 response.release_conn()
+
+            // Get object data only if it is changed.
+            try:
+                response = minio.get_object('foo', 'bar', not_match_etag=etag)
+                if response.status != 304:
+                    // Read data from response.
+            finally:
+                response.close()
+                response.release_conn()
         """
         check_bucket_name(bucket_name)
         check_non_empty_string(object_name)
@@ -1082,6 +1328,16 @@ class Minio:  # pylint: disable=too-many-public-methods
 
         headers = ssec.headers() if ssec else {}
         headers.update(request_headers or {})
+        if match_etag:
+            headers["If-Match"] = '"' + match_etag.strip('"') + '"'
+        if not_match_etag:
+            headers["If-None-Match"] = '"' + not_match_etag.strip('"') + '"'
+        if modified_since:
+            headers["If-Modified-Since"] = time.to_http_header(modified_since)
+        if unmodified_since:
+            headers["If-Unmodified-Since"] = time.to_http_header(
+                unmodified_since,
+            )
 
         if offset or length:
             headers['Range'] = 'bytes={}-{}'.format(
@@ -1098,7 +1354,71 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=headers,
             query_params=extra_query_params,
             preload_content=False,
+            allow_not_modified=bool(not_match_etag or modified_since),
+        )
+
+    def get_cached_object(self, bucket_name, object_name, ssec=None,
+                          version_id=None):
+        """
+        Get path of a local file having data of an object using the content
+        cache of the client. Cached data is revalidated by a conditional GET
+        request using its ETag; data is downloaded only if the object is
+        changed or not cached. If the cache has a maximum size, the returned
+        file may be evicted by later calls, so open it right away.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Object name in the bucket.
+        :param ssec: Server-side encryption customer key.
+        :param version_id: Version-ID of the object.
+        :return: Path of the cached file.
+
+        Example::
+            minio = Minio("play.min.io", content_cache=ContentCache("/tmp/c"))
+            with open(minio.get_cached_object("foo", "config.json")) as file:
+                config = json.load(file)
+        """
+        if not self._content_cache:
+            raise ValueError("content cache is not set to the client")
+
+        path, etag = self._content_cache.get(
+            bucket_name, object_name, version_id,
         )
+        response = None
+        try:
+            response = self.get_object(
+                bucket_name,
+                object_name,
+                ssec=ssec,
+                version_id=version_id,
+                not_match_etag=etag,
+            )
+            if response.status == 304:
+                try:
+                    os.utime(path)  # Mark as recently used.
+                    return path
+                except FileNotFoundError:
+                    # Evicted by a concurrent put() after lookup; treat it as
+                    # a cache miss.
+                    response.close()
+                    response.release_conn()
+                    response = None
+                    response = self.get_object(
+                        bucket_name,
+                        object_name,
+                        ssec=ssec,
+                        version_id=version_id,
+                    )
+            return self._content_cache.put(
+                bucket_name,
+                object_name,
+                response.getheader("etag", "").replace('"', ""),
+                response.stream(amt=1024*1024),
+                version_id=version_id,
+            )
+        finally:
+            if response:
+                response.close()
+                response.release_conn()
 
     def copy_object(self, bucket_name, object_name, object_source,
                     conditions=None, source_sse=None, sse=None, metadata=None):
@@ -1151,6 +1471,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             object_name=object_name,
             headers=headers,
         )
+        self._invalidate_stat(bucket_name, object_name)
         element = ET.fromstring(response.data.decode())
         etag = findtext(element, "ETag")
         if etag:
@@ -1197,6 +1518,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             },
             query_params={'uploadId': upload_id},
         )
+        self._invalidate_stat(bucket_name, object_name)
         return CompleteMultipartUploadResult(response)
 
     def _create_multipart_upload(self, bucket_name, object_name, headers):
@@ -1224,6 +1546,8 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=headers,
             query_params=query_params,
         )
+        if not query_params:
+            self._invalidate_stat(bucket_name, object_name)
         return ObjectWriteResult(
             bucket_name,
             object_name,
@@ -1384,7 +1708,8 @@ class Minio:  # pylint: disable=too-many-public-methods
 
     def list_objects(self, bucket_name, prefix=None, recursive=False,
                      start_after=None, include_user_meta=False,
-                     include_version=False, use_api_v1=False):
+                     include_version=False, use_api_v1=False,
+                     prefetch_pages=0):
         """
         Lists object information of a bucket using S3 API version 2, optionally
         for prefix recursively.
@@ -1398,6 +1723,8 @@ class Minio:  # pylint: disable=too-many-public-methods
         :param include_version: Flag to control whether include object
                                 versions.
         :param use_api_v1: Flag to control to use ListObjectV1 S3 API or not.
+        :param prefetch_pages: Number of pages to fetch in background ahead
+                               of the page being consumed.
         :return: An iterator contains object information.
 
         Example::
@@ -1431,7 +1758,18 @@ class Minio:  # pylint: disable=too-many-public-methods
             )
             for object in objects:
                 print(object)
+
+            # List objects information recursively while fetching up to two
+            # next pages in background.
+            objects = minio.list_objects(
+                'foo', recursive=True, prefetch_pages=2,
+            )
+            for object in objects:
+                print(object)
         """
+        if prefetch_pages < 0:
+            raise ValueError("prefetch_pages must be non-negative")
+
         return self._list_objects(
             bucket_name,
             delimiter=None if recursive else "/",
@@ -1440,7 +1778,355 @@ class Minio:  # pylint: disable=too-many-public-methods
             start_after=start_after,
             use_api_v1=use_api_v1,
             include_version=include_version,
+            prefetch_pages=prefetch_pages,
+        )
+
+    def list_objects_columnar(self, bucket_name, prefix=None,
+                              recursive=False, start_after=None,
+                              include_version=False, use_api_v1=False,
+                              prefetch_pages=0, as_numpy=False):
+        """
+        Lists object information of a bucket as columnar batches, one batch
+        per listing page. Each batch is a dict of equal length lists keyed
+        by object_name, size, last_modified, etag, version_id, is_latest and
+        is_delete_marker, or a NumPy structured array with those fields if
+        as_numpy is set.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param recursive: List recursively than directory structure emulation.
+        :param start_after: List objects after this key name.
+        :param include_version: Flag to control whether include object
+                                versions.
+        :param use_api_v1: Flag to control to use ListObjectV1 S3 API or not.
+        :param prefetch_pages: Number of pages to fetch in background ahead
+                               of the page being consumed.
+        :param as_numpy: Flag to yield NumPy structured arrays; requires
+                         numpy package.
+        :return: An iterator contains batches of object information.
+
+        Example::
+            batches = minio.list_objects_columnar('foo', recursive=True)
+            for batch in batches:
+                print(len(batch["object_name"]), sum(batch["size"]))
+
+            # Build a pandas DataFrame from structured arrays.
+            frame = pandas.concat(
+                pandas.DataFrame(batch) for batch in
+                minio.list_objects_columnar('foo', as_numpy=True)
+            )
+        """
+        if prefetch_pages < 0:
+            raise ValueError("prefetch_pages must be non-negative")
+        if as_numpy and importlib.util.find_spec("numpy") is None:
+            raise ValueError("as_numpy requires numpy package")
+
+        batches = functools.partial(
+            self._list_object_columns,
+            bucket_name,
+            as_numpy,
+            delimiter=None if recursive else "/",
+            prefix=prefix,
+            start_after=start_after,
+            use_api_v1=use_api_v1,
+            include_version=include_version,
         )
+        if prefetch_pages:
+            return iterate_parallel(
+                [batches], 1, ordered=True, queue_size=prefetch_pages,
+            )
+        return batches()
+
+    def list_objects_parallel(self, bucket_name, prefix=None,
+                              split_points=None, num_workers=4, ordered=True,
+                              include_user_meta=False, include_version=False):
+        """
+        Lists object information of a bucket recursively by listing shards of
+        the key space concurrently. Shards are either separated by given split
+        points or discovered by listing prefixes under given prefix with '/'
+        delimiter.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param split_points: Sorted object names separating shards; a shard
+                             lists objects after previous split point up to
+                             and including next split point.
+        :param num_workers: Number of shards listed concurrently.
+        :param ordered: Flag to yield objects sorted by name; otherwise
+                        objects are yielded as soon as they are listed.
+        :param include_user_meta: MinIO specific flag to control to include
+                                 user metadata.
+        :param include_version: Flag to control whether include object
+                                versions.
+        :return: An iterator contains object information.
+
+        Example::
+            # List objects information using discovered prefixes as shards.
+            objects = minio.list_objects_parallel('foo', num_workers=8)
+            for object in objects:
+                print(object)
+
+            # List objects information in any order using given split points.
+            objects = minio.list_objects_parallel(
+                'foo', split_points=['4', '8', 'c'], ordered=False,
+            )
+            for object in objects:
+                print(object)
+        """
+        check_bucket_name(bucket_name)
+        kwargs = {
+            "prefix": prefix,
+            "include_user_meta": include_user_meta,
+            "include_version": include_version,
+        }
+        if split_points:
+            split_points = list(split_points)
+            if split_points != sorted(split_points):
+                raise ValueError("split points must be sorted")
+            tasks = (
+                functools.partial(
+                    self._list_shard, bucket_name, start_after, end_at,
+                    **kwargs
+                )
+                for start_after, end_at in zip(
+                    [None] + split_points, split_points + [None],
+                )
+            )
+        else:
+            tasks = self._discover_shards(bucket_name, **kwargs)
+
+        for objects in iterate_parallel(tasks, num_workers, ordered=ordered):
+            for obj in objects:
+                yield obj
+
+    def _list_shard(self, bucket_name, start_after, end_at, **kwargs):
+        """List pages of objects after start_after up to end_at."""
+        for result in self._list_object_pages(
+                bucket_name, start_after=start_after, **kwargs
+        ):
+            objects = []
+            for obj in result:
+                if end_at is not None and obj.object_name > end_at:
+                    yield objects
+                    return
+                objects.append(obj)
+            yield objects
+
+    def _discover_shards(self, bucket_name, prefix=None, **kwargs):
+        """
+        Generate listing tasks of each prefix under given prefix; objects
+        directly under given prefix are returned as-is in between.
+        """
+        entries = sorted(
+            self._list_objects(
+                bucket_name, delimiter="/", prefix=prefix, **kwargs
+            ),
+            key=lambda obj: obj.object_name,
+        )
+        objects = []
+        for entry in entries:
+            if not entry.is_dir or entry.size is not None:
+                objects.append(entry)
+                continue
+            if objects:
+                yield functools.partial(iter, [objects])
+                objects = []
+            yield functools.partial(
+                self._list_object_lists,
+                bucket_name,
+                prefix=entry.object_name,
+                **kwargs
+            )
+        if objects:
+            yield functools.partial(iter, [objects])
+
+    def prefix_usage(self, bucket_name, prefix=None, depth=1,
+                     include_version=False, num_workers=4):
+        """
+        Get number of objects and total size of objects under each prefix
+        found at given depth below prefix. Prefixes are found by listing with
+        '/' delimiter, then each prefix is listed recursively in parallel and
+        sizes are summed page by page. Objects directly under a shallower
+        level are accounted to that level's prefix.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Find prefixes under this prefix.
+        :param depth: Number of '/' separated levels below prefix.
+        :param include_version: Flag to account all object versions; delete
+                                markers are not counted.
+        :param num_workers: Number of prefixes listed concurrently.
+        :return: List of :class:`PrefixUsage <PrefixUsage>` sorted by prefix.
+
+        Example::
+            for usage in minio.prefix_usage("my-bucketname"):
+                print(usage.prefix, usage.object_count, usage.size)
+        """
+        check_bucket_name(bucket_name)
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        totals = {}
+
+        def add(name, count, size):
+            total = totals.setdefault(name, [0, 0])
+            total[0] += count
+            total[1] += size
+
+        prefixes = [prefix or ""]
+        for _ in range(depth):
+            subprefixes = []
+            for parent in prefixes:
+                for result in self._list_object_pages(
+                        bucket_name, delimiter="/", prefix=parent,
+                        include_version=include_version,
+                ):
+                    count, size = 0, 0
+                    for obj in result:
+                        if (
+                                obj.is_dir and obj.size is None and
+                                obj.version_id is None
+                        ):
+                            subprefixes.append(obj.object_name)
+                        elif not obj.is_delete_marker:
+                            count += 1
+                            size += obj.size or 0
+                    if count:
+                        add(parent, count, size)
+            prefixes = subprefixes
+
+        for name, count, size in iterate_parallel(
+                (
+                    functools.partial(
+                        self._prefix_usage_pages, bucket_name, name,
+                        include_version,
+                    )
+                    for name in prefixes
+                ),
+                num_workers,
+        ):
+            add(name, count, size)
+        for name in prefixes:
+            totals.setdefault(name, [0, 0])
+
+        return [
+            PrefixUsage(name, count, size)
+            for name, (count, size) in sorted(totals.items())
+        ]
+
+    def _prefix_usage_pages(self, bucket_name, prefix, include_version):
+        """Yield prefix, object count and size of each listing page."""
+        for result in self._list_object_pages(
+                bucket_name, prefix=prefix, include_version=include_version,
+        ):
+            count, size = 0, 0
+            for obj in result:
+                if not obj.is_delete_marker:
+                    count += 1
+                    size += obj.size or 0
+            yield prefix, count, size
+
+    def list_incomplete_uploads(self, bucket_name, prefix=None,
+                                older_than=None):
+        """
+        List in-progress multipart uploads of a bucket page by page.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param older_than: List uploads initiated before this duration.
+        :return: An iterator contains :class:`Upload <Upload>` object.
+
+        Example::
+            uploads = minio.list_incomplete_uploads(
+                "my-bucketname", older_than=timedelta(days=1),
+            )
+            for upload in uploads:
+                print(upload.object_name, upload.upload_id)
+        """
+        check_bucket_name(bucket_name)
+        initiated_before = (
+            None if older_than is None else time.utcnow() - older_than
+        )
+        key_marker = None
+        upload_id_marker = None
+        while True:
+            result = self._list_multipart_uploads(
+                bucket_name,
+                key_marker=key_marker,
+                prefix=prefix,
+                upload_id_marker=upload_id_marker,
+            )
+            for upload in result.uploads:
+                if (
+                        initiated_before is None or
+                        (upload.initiated_time and
+                         upload.initiated_time < initiated_before)
+                ):
+                    yield upload
+            if not result.is_truncated:
+                break
+            key_marker = result.next_key_marker
+            upload_id_marker = result.next_upload_id_marker
+
+    def abort_incomplete_uploads(self, bucket_name, prefix=None,
+                                 older_than=timedelta(days=1),
+                                 num_workers=4):
+        """
+        Abort in-progress multipart uploads of a bucket initiated before
+        given duration, e.g. uploads left behind by interrupted put_object()
+        calls. Uploads are aborted concurrently; uploads already completed or
+        aborted meanwhile are skipped.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name starts with prefix.
+        :param older_than: Abort uploads initiated before this duration; None
+                           aborts all uploads.
+        :param num_workers: Number of uploads aborted concurrently.
+        :return: An iterator contains :class:`AbortedUpload <AbortedUpload>`
+            object with reclaimed number of parts and bytes.
+
+        Example::
+            aborted = minio.abort_incomplete_uploads(
+                "my-bucketname", older_than=timedelta(days=7),
+            )
+            for upload in aborted:
+                print(upload.object_name, upload.part_count, upload.size)
+        """
+        check_bucket_name(bucket_name)
+        return iterate_parallel(
+            (
+                functools.partial(self._abort_upload, bucket_name, upload)
+                for upload in self.list_incomplete_uploads(
+                    bucket_name, prefix=prefix, older_than=older_than,
+                )
+            ),
+            num_workers,
+        )
+
+    def _abort_upload(self, bucket_name, upload):
+        """Count parts of an upload and abort it."""
+        part_count, size = 0, 0
+        part_number_marker = None
+        try:
+            while True:
+                result = self._list_parts(
+                    bucket_name,
+                    upload.object_name,
+                    upload.upload_id,
+                    part_number_marker=part_number_marker,
+                )
+                part_count += len(result.parts)
+                size += sum(part.size or 0 for part in result.parts)
+                if not result.is_truncated:
+                    break
+                part_number_marker = result.next_part_number_marker
+            self._abort_multipart_upload(
+                bucket_name, upload.object_name, upload.upload_id,
+            )
+        except S3Error as exc:
+            if exc.code != "NoSuchUpload":
+                raise
+            return []
+        return [AbortedUpload(upload, part_count, size)]
 
     def stat_object(self, bucket_name, object_name, ssec=None, version_id=None,
                     extra_query_params=None):
@@ -1462,7 +2148,18 @@ class Minio:  # pylint: disable=too-many-public-methods
         check_non_empty_string(object_name)
         check_ssec(ssec)
 
+        cache = (
+            self._stat_cache if not ssec and not extra_query_params else None
+        )
+        cached = None
+        if cache:
+            cached, fresh = cache.get(bucket_name, object_name, version_id)
+            if fresh:
+                return cached
+
         headers = ssec.headers() if ssec else {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = '"' + cached.etag + '"'
         query_params = extra_query_params or {}
         query_params.update({"versionId": version_id} if version_id else {})
         response = self._execute(
@@ -1471,22 +2168,99 @@ class Minio:  # pylint: disable=too-many-public-methods
             object_name,
             headers=headers,
             query_params=query_params,
+            allow_not_modified=bool(cached and cached.etag),
         )
 
-        last_modified = response.getheader("last-modified")
-        if last_modified:
-            last_modified = time.from_http_header(last_modified)
+        if response.status == 304 and cached:
+            obj = cached
+        else:
+            last_modified = response.getheader("last-modified")
+            if last_modified:
+                last_modified = time.from_http_header(last_modified)
 
-        return Object(
-            bucket_name,
-            object_name,
-            last_modified=last_modified,
-            etag=response.getheader("etag", "").replace('"', ""),
-            size=int(response.getheader("content-length", "0")),
-            content_type=response.getheader("content-type"),
-            metadata=response.headers,
-            version_id=response.getheader("x-amz-version-id"),
-        )
+            obj = Object(
+                bucket_name,
+                object_name,
+                last_modified=last_modified,
+                etag=response.getheader("etag", "").replace('"', ""),
+                size=int(response.getheader("content-length", "0")),
+                content_type=response.getheader("content-type"),
+                metadata=response.headers,
+                version_id=response.getheader("x-amz-version-id"),
+            )
+        if cache:
+            cache.set(bucket_name, object_name, obj, version_id)
+        return obj
+
+    def _invalidate_stat(self, bucket_name, object_name):
+        """Remove cached stat_object() result of an object."""
+        if self._stat_cache:
+            self._stat_cache.invalidate(bucket_name, object_name)
+
+    def stat_objects(self, bucket_name, objects, ssec=None, num_workers=8,
+                     ordered=False):
+        """
+        Get object information and metadata of multiple objects using
+        concurrent stat_object() calls. Failure of an object is reported in
+        its result instead of stopping other objects.
+
+        :param bucket_name: Name of the bucket.
+        :param objects: An iterable of object names or (object name, version
+                        ID) tuples.
+        :param ssec: Server-side encryption customer key.
+        :param num_workers: Number of concurrent requests; values above
+                            connection pool size of the client cause extra
+                            connections to be discarded after use.
+        :param ordered: Flag to yield results in order of objects; otherwise
+                        results are yielded as they complete.
+        :return: An iterator contains
+            :class:`StatObjectResult <StatObjectResult>` object.
+
+        Example::
+            results = minio.stat_objects(
+                "my-bucketname",
+                ["my-objectname1", ("my-objectname2", "my-versionid")],
+            )
+            for result in results:
+                if result.error:
+                    print(result.object_name, result.error)
+                else:
+                    print(result.object_name, result.object.size)
+        """
+        check_bucket_name(bucket_name)
+        check_ssec(ssec)
+
+        def tasks():
+            for obj in objects:
+                object_name, version_id = (
+                    (obj, None) if isinstance(obj, str) else obj
+                )
+                yield functools.partial(
+                    self._stat_object_result,
+                    bucket_name,
+                    object_name,
+                    version_id,
+                    ssec,
+                )
+
+        return iterate_parallel(tasks(), num_workers, ordered=ordered)
+
+    def _stat_object_result(self, bucket_name, object_name, version_id,
+                            ssec):
+        """Get stat_object() result or error of an object."""
+        try:
+            result = StatObjectResult(
+                object_name,
+                version_id,
+                obj=self.stat_object(
+                    bucket_name, object_name, ssec=ssec,
+                    version_id=version_id,
+                ),
+            )
+        except (MinioException, ValueError,
+                urllib3.exceptions.HTTPError) as exc:
+            result = StatObjectResult(object_name, version_id, error=exc)
+        return [result]
 
     def remove_object(self, bucket_name, object_name, version_id=None):
         """
@@ -1512,6 +2286,7 @@ class Minio:  # pylint: disable=too-many-public-methods
             object_name,
             query_params={"versionId": version_id} if version_id else None,
         )
+        self._invalidate_stat(bucket_name, object_name)
 
     def _delete_objects(self, bucket_name, delete_object_list,
                         quiet=False, bypass_governance_mode=False):
@@ -1536,6 +2311,8 @@ class Minio:  # pylint: disable=too-many-public-methods
             headers=headers,
             query_params={"delete": ""},
         )
+        for obj in delete_object_list:
+            self._invalidate_stat(bucket_name, obj.name)
 
         element = ET.fromstring(response.data.decode())
         return (
@@ -1545,7 +2322,7 @@ class Minio:  # pylint: disable=too-many-public-methods
         )
 
     def remove_objects(self, bucket_name, delete_object_list,
-                       bypass_governance_mode=False):
+                       bypass_governance_mode=False, num_parallel_deletes=1):
         """
         Remove multiple objects.
 
@@ -1553,6 +2330,8 @@ class Minio:  # pylint: disable=too-many-public-methods
         :param delete_object_list: An iterable containing
             :class:`DeleteObject <DeleteObject>` object.
         :param bypass_governance_mode: Bypass Governance retention mode.
+        :param num_parallel_deletes: Number of DeleteObjects requests of up
+            to 1000 objects each kept in flight.
         :return: An iterator containing :class:`DeleteError <DeleteError>`
             object.
 
@@ -1570,32 +2349,128 @@ class Minio:  # pylint: disable=too-many-public-methods
             )
             for error in errors:
                 print("error occured when deleting object", error)
+
+            # Remove objects with four requests in flight.
+            errors = minio.remove_objects(
+                "my-bucketname",
+                (
+                    DeleteObject(obj.object_name) for obj in
+                    minio.list_objects("my-bucketname", recursive=True)
+                ),
+                num_parallel_deletes=4,
+            )
+            for error in errors:
+                print("error occured when deleting object", error)
         """
         check_bucket_name(bucket_name)
+        if num_parallel_deletes < 1:
+            raise ValueError("num_parallel_deletes must be at least 1")
 
-        # turn list like objects into an iterator.
-        delete_object_list = itertools.chain(delete_object_list)
+        tasks = (
+            functools.partial(
+                self._delete_object_errors,
+                bucket_name,
+                objects,
+                bypass_governance_mode,
+            )
+            for objects in _delete_batches(delete_object_list)
+        )
 
-        while True:
-            # get 1000 entries or whatever available.
-            objects = [
-                delete_object for _, delete_object in zip(
-                    range(1000), delete_object_list,
-                )
-            ]
+        if num_parallel_deletes == 1:
+            for task in tasks:
+                for error in task():
+                    yield error
+            return
+
+        # Batches are taken from the iterator only when a request slot is
+        # free, so memory stays bounded by in-flight batches.
+        for error in iterate_parallel(tasks, num_parallel_deletes):
+            yield error
+
+    def _delete_object_errors(self, bucket_name, delete_object_list,
+                              bypass_governance_mode):
+        """Delete multiple objects quietly and return errors."""
+        return self._delete_objects(
+            bucket_name,
+            delete_object_list,
+            quiet=True,
+            bypass_governance_mode=bypass_governance_mode,
+        ).error_list
 
-            if not objects:
-                break
+    def remove_prefix(self, bucket_name, prefix, include_version=False,
+                      bypass_governance_mode=False, num_parallel_deletes=4,
+                      prefetch_pages=2, progress=None):
+        """
+        Remove all objects whose names start with prefix. Objects are listed
+        in background while batches of up to 1000 listed objects are removed
+        concurrently.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Object name prefix.
+        :param include_version: Flag to remove all object versions and delete
+                                markers.
+        :param bypass_governance_mode: Bypass Governance retention mode.
+        :param num_parallel_deletes: Number of DeleteObjects requests kept in
+                                     flight.
+        :param prefetch_pages: Number of listing pages fetched ahead of
+                               removal.
+        :param progress: A callable called with number of removed objects and
+                         number of errors so far after each batch.
+        :return: An iterator containing :class:`DeleteError <DeleteError>`
+            object.
 
-            result = self._delete_objects(
+        Example::
+            def progress(removed, failed):
+                print("removed", removed, "failed", failed)
+
+            errors = minio.remove_prefix(
+                "my-bucketname", "my-prefix/", include_version=True,
+                progress=progress,
+            )
+            for error in errors:
+                print("error occured when deleting object", error)
+        """
+        check_bucket_name(bucket_name)
+        check_non_empty_string(prefix)
+        if num_parallel_deletes < 1:
+            raise ValueError("num_parallel_deletes must be at least 1")
+        if prefetch_pages < 0:
+            raise ValueError("prefetch_pages must be non-negative")
+
+        objects = (
+            DeleteObject(
+                obj.object_name,
+                obj.version_id if include_version else None,
+            )
+            for obj in self._list_objects(
                 bucket_name,
-                objects,
-                quiet=True,
-                bypass_governance_mode=bypass_governance_mode,
+                prefix=prefix,
+                include_version=include_version,
+                prefetch_pages=prefetch_pages,
             )
-
-            for error in result.error_list:
+        )
+        tasks = (
+            functools.partial(
+                self._remove_batch, bucket_name, batch, bypass_governance_mode,
+            )
+            for batch in _delete_batches(objects)
+        )
+        removed, failed = 0, 0
+        for count, errors in iterate_parallel(tasks, num_parallel_deletes):
+            removed += count - len(errors)
+            failed += len(errors)
+            for error in errors:
                 yield error
+            if progress:
+                progress(removed, failed)
+
+    def _remove_batch(self, bucket_name, delete_object_list,
+                      bypass_governance_mode):
+        """Delete a batch of objects; return its size and errors."""
+        errors = self._delete_object_errors(
+            bucket_name, delete_object_list, bypass_governance_mode,
+        )
+        return [(len(delete_object_list), errors)]
 
     def presigned_url(self, method,
                       bucket_name,
@@ -2313,7 +3188,45 @@ class Minio:  # pylint: disable=too-many-public-methods
             query_params=query_params,
         )
 
-    def _list_objects(  # pylint: disable=too-many-arguments,too-many-branches
+    def _list_objects(self, bucket_name, prefetch_pages=0, **kwargs):
+        """
+        List objects optionally including versions. If prefetch_pages is set,
+        next pages are fetched in background while current page is consumed.
+        Note: Its required to send empty values to delimiter/prefix and 1000 to
+        max-keys when not provided for server-side bucket policy evaluation to
+        succeed; otherwise AccessDenied error will be returned for such
+        policies.
+        """
+        pages = (
+            iterate_parallel(
+                [
+                    functools.partial(
+                        self._list_object_lists, bucket_name, **kwargs
+                    ),
+                ],
+                1,
+                ordered=True,
+                queue_size=prefetch_pages,
+            )
+            if prefetch_pages
+            else self._list_object_pages(bucket_name, **kwargs)
+        )
+        for objects in pages:
+            for obj in objects:
+                yield obj
+
+    def _list_object_columns(self, bucket_name, as_numpy, **kwargs):
+        """List objects as columnar batch per page."""
+        for result in self._list_object_pages(bucket_name, **kwargs):
+            columns = result.columns()
+            yield columns_to_numpy(columns) if as_numpy else columns
+
+    def _list_object_lists(self, bucket_name, **kwargs):
+        """List objects as a list per page."""
+        for result in self._list_object_pages(bucket_name, **kwargs):
+            yield list(result)
+
+    def _list_object_pages(  # pylint: disable=too-many-branches
             self,
             bucket_name,
             continuation_token=None,  # listV2 only
@@ -2329,11 +3242,10 @@ class Minio:  # pylint: disable=too-many-public-methods
             include_version=False,
     ):
         """
-        List objects optionally including versions.
-        Note: Its required to send empty values to delimiter/prefix and 1000 to
-        max-keys when not provided for server-side bucket policy evaluation to
-        succeed; otherwise AccessDenied error will be returned for such
-        policies.
+        List objects optionally including versions page by page. Each page is
+        yielded as :class:`ListObjectsResult <ListObjectsResult>` streaming
+        objects from the response; the page is consumed fully before next
+        page is requested.
         """
 
         check_bucket_name(bucket_name)
@@ -2371,20 +3283,21 @@ class Minio:  # pylint: disable=too-many-public-methods
             if version_id_marker:
                 query["version-id-marker"] = version_id_marker
 
-            response = self._execute("GET", bucket_name, query_params=query)
-
-            objects, is_truncated, start_after, version_id_marker = (
-                parse_list_objects(response, bucket_name)
+            response = self._execute(
+                "GET", bucket_name, query_params=query, preload_content=False,
             )
+            result = ListObjectsResult(response, bucket_name)
+            yield result
+            result.close()
 
+            is_truncated = result.is_truncated
+            start_after = result.continuation_token
+            version_id_marker = result.version_id_marker
             if not include_version:
                 version_id_marker = None
                 if not use_api_v1:
                     continuation_token = start_after
 
-            for obj in objects:
-                yield obj
-
     def _list_multipart_uploads(self, bucket_name, delimiter=None,
                                 encoding_type=None, key_marker=None,
                                 max_uploads=None, prefix=None,
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage, (C)
+# 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Caches used by the client."""
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class RegionCache:
+    """
+    Thread-safe cache of bucket regions.
+
+    Concurrent lookups of the same uncached bucket are coalesced into a single
+    call of the fetch function. Entries optionally expire after ``ttl``
+    seconds. When ``filename`` is given, entries are also persisted to that
+    JSON file so that co-located processes share resolved regions.
+
+    :param ttl: Optional time-to-live of an entry in seconds.
+    :param filename: Optional JSON file to share entries across processes.
+
+    Example::
+        cache = RegionCache(ttl=3600, filename="/tmp/minio-regions.json")
+        client = Minio("s3.amazonaws.com", region_cache=cache)
+    """
+
+    def __init__(self, ttl=None, filename=None):
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number")
+        self._ttl = ttl
+        self._filename = filename
+        self._file_mtime = None
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, bucket_name):
+        """Get unexpired region from memory or file; lock must be held."""
+        entry = self._entries.get(bucket_name)
+        if entry is None and self._filename:
+            self._load()
+            entry = self._entries.get(bucket_name)
+        if entry is None:
+            return None
+        region, expiry = entry
+        if expiry is not None and expiry <= time.time():
+            del self._entries[bucket_name]
+            return None
+        return region
+
+    def _read_file(self):
+        """Read entries from file."""
+        try:
+            with open(self._filename) as cache_file:
+                data = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return {}
+        return {
+            bucket_name: (entry[0], entry[1])
+            for bucket_name, entry in data.items()
+            if isinstance(entry, list) and len(entry) == 2
+        }
+
+    def _load(self):
+        """Merge entries from file if it is modified; lock must be held."""
+        try:
+            mtime = os.stat(self._filename).st_mtime_ns
+        except (IOError, OSError):
+            return
+        if mtime == self._file_mtime:
+            return
+        self._file_mtime = mtime
+        for bucket_name, entry in self._read_file().items():
+            self._entries.setdefault(bucket_name, entry)
+
+    @contextmanager
+    def _lock_file(self):
+        """
+        Exclusively lock a sidecar lock file. The cache file itself is
+        replaced on every write, so a lock on it would not serialize writers.
+        """
+        fileno = os.open(
+            self._filename + ".lock", os.O_RDWR | os.O_CREAT, 0o600,
+        )
+        try:
+            if fcntl:
+                fcntl.flock(fileno, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fileno)  # This releases the lock as well.
+
+    def _save(self, bucket_name, entry):
+        """Write entry to file atomically; lock must be held."""
+        try:
+            with self._lock_file():
+                self._update_file(bucket_name, entry)
+        except (IOError, OSError):
+            pass  # Lock file is not writable; skip persistence.
+
+    def _update_file(self, bucket_name, entry):
+        """Read, modify and replace the file; file lock must be held."""
+        data = self._read_file()
+        now = time.time()
+        data = {
+            key: value for key, value in data.items()
+            if value[1] is None or value[1] > now
+        }
+        if entry is None:
+            data.pop(bucket_name, None)
+        else:
+            data[bucket_name] = entry
+        tmp_filename = "{0}.{1}.{2}.tmp".format(
+            self._filename, os.getpid(), threading.get_ident(),
+        )
+        try:
+            with open(tmp_filename, "w") as tmp_file:
+                json.dump(data, tmp_file)
+            os.replace(tmp_filename, self._filename)
+            self._file_mtime = os.stat(self._filename).st_mtime_ns
+        except (IOError, OSError):
+            # Persistence is best effort; memory cache is still valid.
+            try:
+                os.remove(tmp_filename)
+            except (IOError, OSError):
+                pass
+
+    def get(self, bucket_name, fetch_func=None):
+        """
+        Get region of a bucket. If region is not cached and fetch_func is
+        given, it is called with the bucket name to fetch the region; other
+        threads asking for the same bucket wait for its result.
+        """
+        while True:
+            with self._lock:
+                region = self._lookup(bucket_name)
+                if region or not fetch_func:
+                    return region
+                event = self._inflight.get(bucket_name)
+                owner = event is None
+                if owner:
+                    event = threading.Event()
+                    self._inflight[bucket_name] = event
+
+            if owner:
+                break
+
+            # Another thread is fetching; use its result or retry on failure.
+            event.wait()
+
+        try:
+            region = fetch_func(bucket_name)
+            self.set(bucket_name, region)
+            return region
+        finally:
+            with self._lock:
+                self._inflight.pop(bucket_name, None)
+            event.set()
+
+    def set(self, bucket_name, region):
+        """Set region of a bucket."""
+        entry = (
+            region,
+            time.time() + self._ttl if self._ttl is not None else None,
+        )
+        with self._lock:
+            self._entries[bucket_name] = entry
+            if self._filename:
+                self._save(bucket_name, list(entry))
+
+    def pop(self, bucket_name):
+        """Remove region of a bucket."""
+        with self._lock:
+            region = self._entries.pop(bucket_name, (None, None))[0]
+            if self._filename:
+                self._save(bucket_name, None)
+            return region
+
+
+class StatCache:
+    """
+    Thread-safe LRU cache of object information returned by stat_object().
+
+    Entries expire after ``ttl`` seconds and least recently used objects are
+    evicted beyond ``max_entries``. The client invalidates entries of objects
+    it writes or removes. When ``revalidate`` is set, expired entries are
+    kept and revalidated by a conditional HEAD request using the cached ETag
+    instead of being fetched again.
+
+    :param ttl: Time-to-live of an entry in seconds.
+    :param max_entries: Maximum number of cached objects.
+    :param revalidate: Flag to revalidate expired entries by ETag.
+
+    Example::
+        cache = StatCache(ttl=30, max_entries=10000, revalidate=True)
+        client = Minio("play.min.io", stat_cache=cache)
+    """
+
+    def __init__(self, ttl=60, max_entries=10000, revalidate=False):
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._revalidate = revalidate
+        # (bucket_name, object_name) => {version_id: (object, expiry)}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def revalidate(self):
+        """Get revalidate flag."""
+        return self._revalidate
+
+    def get(self, bucket_name, object_name, version_id=None):
+        """
+        Get cached object information and whether it is fresh. Expired
+        entry is returned as not fresh if revalidate is set, else it is
+        removed.
+        """
+        key = (bucket_name, object_name)
+        with self._lock:
+            versions = self._entries.get(key)
+            entry = versions.get(version_id) if versions else None
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            obj, expiry = entry
+            if expiry > time.time():
+                return obj, True
+            if self._revalidate:
+                return obj, False
+            del versions[version_id]
+            if not versions:
+                del self._entries[key]
+            return None, False
+
+    def set(self, bucket_name, object_name, obj, version_id=None):
+        """Set object information."""
+        key = (bucket_name, object_name)
+        with self._lock:
+            versions = self._entries.setdefault(key, {})
+            versions[version_id] = (obj, time.time() + self._ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, bucket_name, object_name):
+        """Remove all versions of an object."""
+        with self._lock:
+            self._entries.pop((bucket_name, object_name), None)
+
+
+class ContentCache:
+    """
+    Local file cache of object data keyed by ETag.
+
+    Object data is stored under ``directory`` with the ETag it was downloaded
+    with, so that it can be revalidated by a conditional GET request and
+    reused when unchanged. When ``max_size`` is given, least recently used
+    files are removed once the cache grows beyond that many bytes.
+
+    :param directory: Directory to store cached files.
+    :param max_size: Optional maximum total size of cached files in bytes.
+
+    Example::
+        cache = ContentCache("/var/cache/minio", max_size=10 * 1024 ** 3)
+        client = Minio("play.min.io", content_cache=cache)
+    """
+
+    def __init__(self, directory, max_size=None):
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be a positive number")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def _paths(self, bucket_name, object_name, version_id):
+        """Get data and ETag file paths of an object."""
+        key = hashlib.sha256(
+            "\0".join(
+                [bucket_name, object_name, version_id or ""],
+            ).encode(),
+        ).hexdigest()
+        path = os.path.join(self._directory, key)
+        return path + ".data", path + ".etag"
+
+    def get(self, bucket_name, object_name, version_id=None):
+        """Get path of cached data file and its ETag of an object."""
+        data_path, etag_path = self._paths(
+            bucket_name, object_name, version_id,
+        )
+        try:
+            with open(etag_path) as etag_file:
+                etag = etag_file.read()
+            # Mark as recently used.
+            os.utime(data_path)
+        except (IOError, OSError):
+            return None, None
+        return data_path, etag
+
+    def put(self, bucket_name, object_name, etag, chunks, version_id=None):
+        """
+        Store data chunks of an object with its ETag and return path of the
+        cached data file.
+        """
+        data_path, etag_path = self._paths(
+            bucket_name, object_name, version_id,
+        )
+        suffix = ".{0}.{1}.tmp".format(os.getpid(), threading.get_ident())
+        try:
+            with open(data_path + suffix, "wb") as data_file:
+                for chunk in chunks:
+                    data_file.write(chunk)
+            with open(etag_path + suffix, "w") as etag_file:
+                etag_file.write(etag)
+            # Data is replaced before ETag so that an ETag never refers to
+            # older data.
+            os.replace(data_path + suffix, data_path)
+            os.replace(etag_path + suffix, etag_path)
+        finally:
+            for path in (data_path + suffix, etag_path + suffix):
+                try:
+                    os.remove(path)
+                except (IOError, OSError):
+                    pass
+        if self._max_size:
+            self._evict(data_path)
+        return data_path
+
+    def _evict(self, keep_path):
+        """Remove least recently used files beyond max size."""
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self._directory):
+                if not entry.name.endswith(".data"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except (IOError, OSError):
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+            for _, size, path in sorted(entries):
+                if total <= self._max_size:
+                    break
+                if path == keep_path:
+                    continue
+                for name in (path, path[:-len(".data")] + ".etag"):
+                    try:
+                        os.remove(name)
+                    except (IOError, OSError):
+                        pass
+                total -= size
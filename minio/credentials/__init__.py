@@ -21,5 +21,6 @@ from .credentials import Credentials
 from .providers import (AssumeRoleProvider, AWSConfigProvider, ChainedProvider,
                         ClientGrantsProvider, EnvAWSProvider, EnvMinioProvider,
                         IamAwsProvider, LdapIdentityProvider,
-                        MinioClientConfigProvider, Provider, StaticProvider,
-                        WebIdentityProvider)
+                        MinioClientConfigProvider, Provider,
+                        RefreshingProvider, SharedCacheProvider,
+                        StaticProvider, WebIdentityProvider)
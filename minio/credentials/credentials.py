@@ -57,6 +57,11 @@ class Credentials:
         """Get session token."""
         return self._session_token
 
+    @property
+    def expiration(self):
+        """Get expiration in UTC without timezone information."""
+        return self._expiration
+
     def is_expired(self):
         """Check whether this credentials expired or not."""
         return (
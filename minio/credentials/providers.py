@@ -22,9 +22,11 @@ import json
 import os
 import socket
 import sys
+import threading
 import time
 from abc import ABCMeta, abstractmethod
-from datetime import timedelta
+from contextlib import contextmanager
+from datetime import timedelta, timezone
 from urllib.parse import urlencode, urlsplit
 from xml.etree import ElementTree
 
@@ -32,14 +34,20 @@ import urllib3
 
 from minio.helpers import sha256_hash
 from minio.signer import sign_v4_sts
-from minio.time import from_iso8601utc, to_amz_date, utcnow
+from minio.time import from_iso8601utc, to_amz_date, to_iso8601utc, utcnow
 from minio.xml import find, findtext
 
 from .credentials import Credentials
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 _MIN_DURATION_SECONDS = timedelta(minutes=15).total_seconds()
 _MAX_DURATION_SECONDS = timedelta(days=7).total_seconds()
 _DEFAULT_DURATION_SECONDS = timedelta(hours=1).total_seconds()
+_REFRESH_RETRY_SECONDS = 10
 
 
 def _parse_credentials(data, name):
@@ -66,6 +74,15 @@ def _urlopen(http_client, method, url, body=None, headers=None):
     return res
 
 
+def _get_file_signature(filename):
+    """Get inode, modification time and size of a file if exists."""
+    try:
+        stat = os.stat(filename)
+    except (IOError, OSError):
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
 class Provider:  # pylint: disable=too-few-public-methods
     """Credential retriever."""
     __metaclass__ = ABCMeta
@@ -74,6 +91,10 @@ class Provider:  # pylint: disable=too-few-public-methods
     def retrieve(self):
         """Retrieve credentials and its expiry if available."""
 
+    def refresh(self):
+        """Retrieve new credentials ignoring cached credentials if any."""
+        return self.retrieve()
+
 
 class AssumeRoleProvider(Provider):
     """Assume-role credential provider."""
@@ -130,6 +151,10 @@ class AssumeRoleProvider(Provider):
         if self._credentials and not self._credentials.is_expired():
             return self._credentials
 
+        return self.refresh()
+
+    def refresh(self):
+        """Retrieve new credentials by AssumeRole STS API."""
         utctime = utcnow()
         headers = sign_v4_sts(
             "POST",
@@ -240,9 +265,16 @@ class AWSConfigProvider(Provider):
             os.path.join(os.environ.get("HOME"), ".aws", "credentials")
         )
         self._profile = profile or os.environ.get("AWS_PROFILE") or "default"
+        # Tuple of file signature and credentials parsed from the file.
+        self._cache = (None, None)
 
     def retrieve(self):
         """Retrieve credentials from AWS configuration file."""
+        signature = _get_file_signature(self._filename)
+        cached_signature, credentials = self._cache
+        if signature and signature == cached_signature:
+            return credentials
+
         parser = configparser.ConfigParser()
         parser.read(self._filename)
         access_key = parser.get(
@@ -281,11 +313,13 @@ class AWSConfigProvider(Provider):
                 ),
             )
 
-        return Credentials(
+        credentials = Credentials(
             access_key,
             secret_key,
             session_token=session_token,
         )
+        self._cache = (signature, credentials)
+        return credentials
 
 
 class MinioClientConfigProvider(Provider):
@@ -301,9 +335,16 @@ class MinioClientConfigProvider(Provider):
             )
         )
         self._alias = alias or os.environ.get("MINIO_ALIAS") or "s3"
+        # Tuple of file signature and credentials parsed from the file.
+        self._cache = (None, None)
 
     def retrieve(self):
         """Retrieve credential value from MinIO client configuration file."""
+        signature = _get_file_signature(self._filename)
+        cached_signature, credentials = self._cache
+        if signature and signature == cached_signature:
+            return credentials
+
         try:
             with open(self._filename) as conf_file:
                 config = json.load(conf_file)
@@ -323,7 +364,11 @@ class MinioClientConfigProvider(Provider):
                         self._alias, self._filename,
                     ),
                 )
-            return Credentials(creds.get("accessKey"), creds.get("secretKey"))
+            credentials = Credentials(
+                creds.get("accessKey"), creds.get("secretKey"),
+            )
+            self._cache = (signature, credentials)
+            return credentials
         except (IOError, OSError) as exc:
             raise ValueError(
                 "error in reading file {0}".format(self._filename),
@@ -403,6 +448,10 @@ class IamAwsProvider(Provider):
         if self._credentials and not self._credentials.is_expired():
             return self._credentials
 
+        return self.refresh()
+
+    def refresh(self):
+        """Retrieve new credentials from WebIdentity/EC2/ECS."""
         url = self._custom_endpoint
         if self._token_file:
             if not url:
@@ -477,6 +526,10 @@ class LdapIdentityProvider(Provider):
         if self._credentials and not self._credentials.is_expired():
             return self._credentials
 
+        return self.refresh()
+
+    def refresh(self):
+        """Retrieve new credentials by AssumeRoleWithLDAPIdentity API."""
         res = _urlopen(
             self._http_client,
             "POST",
@@ -551,6 +604,10 @@ class WebIdentityClientGrantsProvider(Provider):
         if self._credentials and not self._credentials.is_expired():
             return self._credentials
 
+        return self.refresh()
+
+    def refresh(self):
+        """Retrieve new credentials by WebIdentity/ClientGrants STS API."""
         jwt = self._jwt_provider_func()
 
         query_params = {"Version": "2011-06-15"}
@@ -612,3 +669,198 @@ class WebIdentityProvider(WebIdentityClientGrantsProvider):
 
     def _is_web_identity(self):
         return True
+
+
+class RefreshingProvider(Provider):
+    """
+    Credential provider wrapper which refreshes credentials of wrapped
+    provider in background well before they expire. Cached credentials are
+    returned without locking; only one refresh runs at a time.
+    """
+
+    def __init__(self, provider, refresh_before=timedelta(minutes=5)):
+        if not isinstance(provider, Provider):
+            raise ValueError("provider must be Provider type")
+        self._provider = provider
+        self._refresh_before = refresh_before.total_seconds()
+        # Tuple of credentials and its refresh time; replaced atomically.
+        self._state = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._refreshing_lock = threading.Lock()
+        self._retry_at = 0
+
+    def _set_credentials(self, credentials):
+        """Cache credentials and compute its refresh time."""
+        refresh_at = None
+        if credentials.expiration:
+            expire_at = credentials.expiration.replace(
+                tzinfo=timezone.utc,
+            ).timestamp()
+            # Refresh at least half way through credentials lifetime, but
+            # not later than Credentials.is_expired() considers them expired.
+            lifetime = max(expire_at - time.time(), 0)
+            refresh_at = expire_at - max(
+                min(self._refresh_before, lifetime / 2), 10,
+            )
+        self._state = (credentials, refresh_at)
+        return credentials
+
+    def _background_refresh(self):
+        """Refresh credentials; errors are retried on later retrieve()."""
+        try:
+            with self._lock:
+                state = self._state
+                if not state or state[1] is None or time.time() >= state[1]:
+                    self._set_credentials(self._provider.refresh())
+        except Exception:  # pylint: disable=broad-except
+            self._retry_at = time.time() + _REFRESH_RETRY_SECONDS
+        finally:
+            self._refreshing = False
+
+    def _start_refresh(self):
+        """Start background refresh if not running already."""
+        if self._refreshing or time.time() < self._retry_at:
+            return
+        with self._refreshing_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def retrieve(self):
+        """Retrieve cached credentials; refresh them if required."""
+        state = self._state
+        if state:
+            credentials, refresh_at = state
+            if refresh_at is None or time.time() < refresh_at:
+                return credentials
+            if not credentials.is_expired():
+                self._start_refresh()
+                return credentials
+
+        with self._lock:
+            state = self._state
+            if state and not state[0].is_expired():
+                return state[0]
+            return self._set_credentials(self._provider.refresh())
+
+    def refresh(self):
+        """Retrieve new credentials from wrapped provider."""
+        with self._lock:
+            return self._set_credentials(self._provider.refresh())
+
+
+class SharedCacheProvider(Provider):
+    """
+    Credential provider wrapper which shares credentials of wrapped provider
+    with other processes on the same host through a locked file. Unexpired
+    credentials found in the file are reused; otherwise the process holding
+    the file lock fetches new credentials and stores them for the others.
+
+    The file contains secrets, hence it is made readable only by the
+    owner. File locking is not available on Windows, where the file is
+    shared without locking.
+    """
+
+    def __init__(self, provider, filename):
+        if not isinstance(provider, Provider):
+            raise ValueError("provider must be Provider type")
+        self._provider = provider
+        self._filename = filename
+        self._credentials = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _open(self):
+        """Open and exclusively lock the cache file."""
+        fileno = os.open(self._filename, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # Mode given to os.open() applies only to a newly created file.
+            if hasattr(os, "fchmod"):
+                os.fchmod(fileno, 0o600)
+            if fcntl:
+                fcntl.flock(fileno, fcntl.LOCK_EX)
+            yield fileno
+        finally:
+            os.close(fileno)  # This releases the lock as well.
+
+    @staticmethod
+    def _read(fileno):
+        """Read credentials from the cache file if valid."""
+        os.lseek(fileno, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            chunk = os.read(fileno, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        try:
+            data = json.loads(b"".join(chunks).decode())
+            return Credentials(
+                data["AccessKeyId"],
+                data["SecretAccessKey"],
+                data.get("SessionToken"),
+                from_iso8601utc(data.get("Expiration")),
+            )
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    @staticmethod
+    def _write(fileno, credentials):
+        """Write credentials to the cache file."""
+        data = json.dumps(
+            {
+                "AccessKeyId": credentials.access_key,
+                "SecretAccessKey": credentials.secret_key,
+                "SessionToken": credentials.session_token,
+                "Expiration": to_iso8601utc(credentials.expiration),
+            },
+        ).encode()
+        os.lseek(fileno, 0, os.SEEK_SET)
+        os.ftruncate(fileno, 0)
+        os.write(fileno, data)
+
+    def _load(self, force):
+        """Load credentials from the cache file or from wrapped provider."""
+        with self._open() as fileno:
+            credentials = self._read(fileno)
+            if credentials and not credentials.is_expired():
+                current = self._credentials
+                if (
+                        not force or not current or
+                        not current.expiration or
+                        not credentials.expiration or
+                        credentials.expiration > current.expiration
+                ):
+                    # Credentials are refreshed by another process already.
+                    self._credentials = credentials
+                    return credentials
+
+            credentials = (
+                self._provider.refresh() if force
+                else self._provider.retrieve()
+            )
+            self._write(fileno, credentials)
+            self._credentials = credentials
+            return credentials
+
+    def retrieve(self):
+        """Retrieve credentials from memory, cache file or wrapped provider."""
+        credentials = self._credentials
+        if credentials and not credentials.is_expired():
+            return credentials
+
+        with self._lock:
+            credentials = self._credentials
+            if credentials and not credentials.is_expired():
+                return credentials
+            return self._load(False)
+
+    def refresh(self):
+        """
+        Retrieve newer credentials from cache file if another process
+        refreshed them already; otherwise from wrapped provider.
+        """
+        with self._lock:
+            return self._load(True)
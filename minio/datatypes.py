@@ -20,6 +20,7 @@ Response of ListBuckets, ListObjects, ListObjectsV2 and ListObjectVersions API.
 
 from __future__ import absolute_import
 
+import itertools
 from urllib.parse import unquote
 from xml.etree import ElementTree as ET
 
@@ -72,8 +73,24 @@ class ListAllMyBucketsResult:
         return cls(buckets)
 
 
+def _local_name(tag):
+    """Get tag name without namespace."""
+    return tag[tag.find("}") + 1:]
+
+
 class Object:
-    """Object information."""
+    """
+    Object information.
+
+    Listing results keep last modified time, ETag, size and user metadata as
+    raw strings; they are decoded on first access of their properties.
+    """
+
+    __slots__ = (
+        "_bucket_name", "_object_name", "_last_modified", "_etag", "_size",
+        "_metadata", "_version_id", "_is_latest", "_storage_class",
+        "_owner_id", "_owner_name", "_content_type",
+    )
 
     def __init__(self,  # pylint: disable=too-many-arguments
                  bucket_name,
@@ -113,21 +130,29 @@ class Object:
     @property
     def last_modified(self):
         """Get last modified time."""
+        if isinstance(self._last_modified, str):
+            self._last_modified = from_iso8601utc(self._last_modified)
         return self._last_modified
 
     @property
     def etag(self):
         """Get etag."""
+        if self._etag is not None and '"' in self._etag:
+            self._etag = self._etag.replace('"', "")
         return self._etag
 
     @property
     def size(self):
         """Get size."""
+        if isinstance(self._size, str):
+            self._size = int(self._size)
         return self._size
 
     @property
     def metadata(self):
         """Get metadata."""
+        if isinstance(self._metadata, tuple):
+            self._metadata = dict(self._metadata)
         return self._metadata
 
     @property
@@ -168,72 +193,234 @@ class Object:
     @classmethod
     def fromxml(cls, element, bucket_name):
         """Create new object with values from XML element."""
-        tag = findtext(element, "LastModified")
-        last_modified = None if tag is None else from_iso8601utc(tag)
-
-        tag = findtext(element, "ETag")
-        etag = None if tag is None else tag.replace('"', "")
-
-        tag = findtext(element, "Size")
-        size = None if tag is None else int(tag)
-
-        tag = find(element, "Owner")
-        owner_id, owner_name = (
-            (None, None) if tag is None
-            else (findtext(tag, "ID"), findtext(tag, "DisplayName"))
-        )
-
-        tag = find(element, "UserMetadata") or []
-        metadata = {}
-        for child in tag:
-            key = child.tag.split("}")[1] if "}" in child.tag else child.tag
-            metadata[key] = child.text
+        values = {}
+        owner_id = owner_name = None
+        metadata = ()
+        for child in element:
+            tag = _local_name(child.tag)
+            if tag == "Owner":
+                for owner in child:
+                    owner_tag = _local_name(owner.tag)
+                    if owner_tag == "ID":
+                        owner_id = owner.text
+                    elif owner_tag == "DisplayName":
+                        owner_name = owner.text
+            elif tag == "UserMetadata":
+                metadata = tuple(
+                    (_local_name(meta.tag), meta.text) for meta in child
+                )
+            else:
+                values[tag] = child.text
 
         return cls(
             bucket_name,
-            findtext(element, "Key"),
-            last_modified=last_modified,
-            etag=etag,
-            size=size,
-            version_id=findtext(element, "VersionId"),
-            is_latest=findtext(element, "IsLatest"),
-            storage_class=findtext(element, "StorageClass"),
+            values.get("Key"),
+            last_modified=values.get("LastModified"),
+            etag=values.get("ETag"),
+            size=values.get("Size"),
+            version_id=values.get("VersionId"),
+            is_latest=values.get("IsLatest"),
+            storage_class=values.get("StorageClass"),
             owner_id=owner_id,
             owner_name=owner_name,
             metadata=metadata,
         )
 
 
-def parse_list_objects(response, bucket_name):
-    """Parse ListObjects/ListObjectsV2/ListObjectVersions response."""
-    element = ET.fromstring(response.data.decode())
-    elements = findall(element, "Contents")
-    objects = [Object.fromxml(tag, bucket_name) for tag in elements]
-    marker = objects[-1].object_name if objects else None
+def _pull_children(chunks):
+    """
+    Parse XML document fed by chunks and yield its root element with each
+    child of the root as soon as the child is parsed.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                if depth == 0:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                yield root, element
+
+
+class ListObjectsResult:
+    """
+    ListObjects/ListObjectsV2/ListObjectVersions API result parsed
+    incrementally from response stream. Iterating this object yields objects
+    as their XML elements are parsed; pagination markers are available
+    after iteration completes.
+    """
+
+    _ENTRIES = ("Contents", "Version", "DeleteMarker", "CommonPrefixes")
+
+    def __init__(self, response, bucket_name):
+        self._response = response
+        self._bucket_name = bucket_name
+        self._fields = {}
+        self._marker = None
+        self._done = False
+
+    def elements(self):
+        """
+        Yield tag name and XML element of object entries as they are parsed.
+        Each element is freed once the next element is requested.
+        """
+        if self._done:
+            return
+
+        completed = False
+        try:
+            for root, element in _pull_children(self._response.stream()):
+                tag = _local_name(element.tag)
+                if tag in self._ENTRIES:
+                    if tag == "Contents":
+                        self._marker = findtext(element, "Key")
+                    yield tag, element
+                else:
+                    self._fields[tag] = element.text
+                root.remove(element)
+            completed = True
+        finally:
+            self._done = True
+            if not completed:
+                # Unread response data makes the connection unusable.
+                self._response.close()
+            self._response.release_conn()
+
+    def __iter__(self):
+        for tag, element in self.elements():
+            if tag == "CommonPrefixes":
+                yield Object(self._bucket_name, findtext(element, "Prefix"))
+            else:
+                yield Object.fromxml(element, self._bucket_name)
+
+    def columns(self):
+        """
+        Get objects as columns; a dict of equal length lists of object names,
+        sizes, last modified times, ETags, version IDs, is-latest flags and
+        delete marker flags filled directly from XML elements.
+        """
+        names, sizes, times, etags = [], [], [], []
+        version_ids, latest_flags, delete_markers = [], [], []
+        for tag, element in self.elements():
+            values = {}
+            for child in element:
+                values[_local_name(child.tag)] = child.text
+            if tag == "CommonPrefixes":
+                names.append(values.get("Prefix"))
+            else:
+                names.append(values.get("Key"))
+            size = values.get("Size")
+            sizes.append(None if size is None else int(size))
+            times.append(from_iso8601utc(values.get("LastModified")))
+            etag = values.get("ETag")
+            etags.append(None if etag is None else etag.replace('"', ""))
+            version_ids.append(values.get("VersionId"))
+            latest_flags.append(
+                (values.get("IsLatest") or "").lower() == "true",
+            )
+            delete_markers.append(tag == "DeleteMarker")
+        return {
+            "object_name": names,
+            "size": sizes,
+            "last_modified": times,
+            "etag": etags,
+            "version_id": version_ids,
+            "is_latest": latest_flags,
+            "is_delete_marker": delete_markers,
+        }
+
+    def close(self):
+        """Consume remaining response to have pagination markers."""
+        for _ in self.elements():
+            pass
 
-    elements = findall(element, "Version")
-    objects += [Object.fromxml(tag, bucket_name) for tag in elements]
+    @property
+    def is_truncated(self):
+        """Get is-truncated flag."""
+        return (self._fields.get("IsTruncated") or "").lower() == "true"
 
-    elements = findall(element, "CommonPrefixes")
-    objects += [
-        Object(bucket_name, findtext(tag, "Prefix"))
-        for tag in elements
-    ]
+    @property
+    def continuation_token(self):
+        """Get continuation token, key marker or marker of next page."""
+        token = self._fields.get("NextKeyMarker")
+        if token is None:
+            token = self._fields.get("NextContinuationToken")
+        if token is None:
+            token = self._fields.get("NextMarker")
+        if token is None and self.is_truncated:
+            token = self._marker
+        return token
+
+    @property
+    def version_id_marker(self):
+        """Get version ID marker of next page."""
+        return self._fields.get("NextVersionIdMarker")
+
+
+class PrefixUsage:
+    """Number of objects and total size of objects under a prefix."""
+
+    def __init__(self, prefix, object_count, size):
+        self._prefix = prefix
+        self._object_count = object_count
+        self._size = size
+
+    @property
+    def prefix(self):
+        """Get prefix."""
+        return self._prefix
 
-    elements = findall(element, "DeleteMarker")
-    objects += [Object.fromxml(tag, bucket_name) for tag in elements]
+    @property
+    def object_count(self):
+        """Get number of objects or object versions."""
+        return self._object_count
 
-    is_truncated = (findtext(element, "IsTruncated") or "").lower() == "true"
-    key_marker = findtext(element, "NextKeyMarker")
-    version_id_marker = findtext(element, "NextVersionIdMarker")
-    continuation_token = findtext(element, "NextContinuationToken")
-    if key_marker is not None:
-        continuation_token = key_marker
-    if continuation_token is None:
-        continuation_token = findtext(element, "NextMarker")
-    if continuation_token is None and is_truncated:
-        continuation_token = marker
-    return objects, is_truncated, continuation_token, version_id_marker
+    @property
+    def size(self):
+        """Get total size in bytes."""
+        return self._size
+
+
+def columns_to_numpy(columns):
+    """
+    Convert object columns to NumPy structured array. Missing size is
+    stored as -1 and missing last modified time as NaT.
+    """
+    # numpy is optional and slow to import, hence imported on first use.
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ValueError("numpy is required for structured arrays") from exc
+    array = numpy.empty(
+        len(columns["object_name"]),
+        dtype=[
+            ("object_name", object),
+            ("size", "i8"),
+            ("last_modified", "datetime64[ms]"),
+            ("etag", object),
+            ("version_id", object),
+            ("is_latest", "?"),
+            ("is_delete_marker", "?"),
+        ],
+    )
+    for name in ("object_name", "etag", "version_id", "is_latest",
+                 "is_delete_marker"):
+        array[name] = columns[name]
+    array["size"] = [-1 if size is None else size for size in columns["size"]]
+    array["last_modified"] = [
+        "NaT" if time is None else time.replace(tzinfo=None)
+        for time in columns["last_modified"]
+    ]
+    return array
 
 
 class CompleteMultipartUploadResult:
@@ -489,6 +676,70 @@ class Upload:
         return self._initiated_time
 
 
+class StatObjectResult:
+    """Result of stat_objects() of an object; either object or error."""
+
+    def __init__(self, object_name, version_id, obj=None, error=None):
+        self._object_name = object_name
+        self._version_id = version_id
+        self._object = obj
+        self._error = error
+
+    @property
+    def object_name(self):
+        """Get object name."""
+        return self._object_name
+
+    @property
+    def version_id(self):
+        """Get requested version ID."""
+        return self._version_id
+
+    @property
+    def object(self):
+        """Get :class:`Object <Object>`; None on error."""
+        return self._object
+
+    @property
+    def error(self):
+        """Get error raised by stat_object(); None on success."""
+        return self._error
+
+
+class AbortedUpload:
+    """Aborted multipart upload with reclaimed parts information."""
+
+    def __init__(self, upload, part_count, size):
+        self._upload = upload
+        self._part_count = part_count
+        self._size = size
+
+    @property
+    def upload(self):
+        """Get :class:`Upload <Upload>` information."""
+        return self._upload
+
+    @property
+    def object_name(self):
+        """Get object name."""
+        return self._upload.object_name
+
+    @property
+    def upload_id(self):
+        """Get upload ID."""
+        return self._upload.upload_id
+
+    @property
+    def part_count(self):
+        """Get number of uploaded parts."""
+        return self._part_count
+
+    @property
+    def size(self):
+        """Get total size of uploaded parts in bytes."""
+        return self._size
+
+
 class ListMultipartUploadsResult:
     """ListMultipartUploads API result."""
 
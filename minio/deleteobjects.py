@@ -28,6 +28,16 @@ class DeleteObject:
         self._name = name
         self._version_id = version_id
 
+    @property
+    def name(self):
+        """Get object name."""
+        return self._name
+
+    @property
+    def version_id(self):
+        """Get version ID."""
+        return self._version_id
+
     def toxml(self, element):
         """Convert to XML."""
         element = SubElement(element, "Object")
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage, (C)
+# 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sorted merge diff of object listings."""
+
+from __future__ import absolute_import
+
+import os
+from datetime import datetime, timezone
+
+from .datatypes import Object
+from .helpers import iterate_parallel
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class DiffEntry:
+    """Difference of an object between old and new listings."""
+
+    def __init__(self, kind, old, new):
+        self._kind = kind
+        self._old = old
+        self._new = new
+
+    @property
+    def kind(self):
+        """Get kind of difference; one of ADDED, REMOVED or CHANGED."""
+        return self._kind
+
+    @property
+    def object_name(self):
+        """Get object name."""
+        return (self._new or self._old).object_name
+
+    @property
+    def old(self):
+        """Get object of old listing; None if the object is added."""
+        return self._old
+
+    @property
+    def new(self):
+        """Get object of new listing; None if the object is removed."""
+        return self._new
+
+
+def _is_changed(old, new, compare_etag):
+    """Check whether size or ETag of an object is changed."""
+    if old.size != new.size:
+        return True
+    return bool(
+        compare_etag and old.etag and new.etag and old.etag != new.etag
+    )
+
+
+def _sorted(objects, prefetch):
+    """Yield objects fetched in background; check they are sorted."""
+    if prefetch > 0:
+        objects = iterate_parallel(
+            [lambda source=objects: source], 1, queue_size=prefetch,
+        )
+    last = None
+    for obj in objects:
+        if last is not None and obj.object_name <= last:
+            raise ValueError(
+                "objects are not sorted by name; {0} is after {1}".format(
+                    obj.object_name, last,
+                ),
+            )
+        last = obj.object_name
+        yield obj
+
+
+def diff(old_objects, new_objects, compare_etag=True, prefetch=1000):
+    """
+    Compare two object listings sorted by object name, e.g. results of
+    list_objects(recursive=True) of two buckets or list_local_objects(), by
+    merge join in constant memory. Both listings are consumed concurrently
+    in background threads.
+
+    :param old_objects: Iterable of old objects sorted by name.
+    :param new_objects: Iterable of new objects sorted by name.
+    :param compare_etag: Flag to compare ETags when both objects have one.
+    :param prefetch: Number of objects read ahead of the merge from each
+                     listing; 0 reads listings in the caller thread.
+    :return: Iterator of :class:`DiffEntry <DiffEntry>` in name order.
+
+    Example::
+        entries = diff(
+            minio.list_objects("my-bucket", recursive=True),
+            minio.list_objects("my-replica", recursive=True),
+        )
+        for entry in entries:
+            print(entry.kind, entry.object_name)
+    """
+    old_iter = _sorted(old_objects, prefetch)
+    new_iter = _sorted(new_objects, prefetch)
+    try:
+        old = next(old_iter, None)
+        new = next(new_iter, None)
+        while old is not None or new is not None:
+            if new is None or (
+                    old is not None and old.object_name < new.object_name
+            ):
+                yield DiffEntry(REMOVED, old, None)
+                old = next(old_iter, None)
+            elif old is None or new.object_name < old.object_name:
+                yield DiffEntry(ADDED, None, new)
+                new = next(new_iter, None)
+            else:
+                if _is_changed(old, new, compare_etag):
+                    yield DiffEntry(CHANGED, old, new)
+                old = next(old_iter, None)
+                new = next(new_iter, None)
+    finally:
+        old_iter.close()
+        new_iter.close()
+
+
+def _walk(path, prefix):
+    """Yield objects of a directory in S3 key order."""
+    with os.scandir(path) as entries:
+        entries = [
+            (entry.name + "/" if entry.is_dir() else entry.name, entry)
+            for entry in entries
+        ]
+    for name, entry in sorted(entries, key=lambda item: item[0]):
+        if name.endswith("/"):
+            for obj in _walk(entry.path, prefix + name):
+                yield obj
+            continue
+        stat = entry.stat()
+        yield Object(
+            None,
+            prefix + name,
+            last_modified=datetime.fromtimestamp(
+                stat.st_mtime, timezone.utc,
+            ),
+            size=stat.st_size,
+        )
+
+
+def list_local_objects(path, prefix=""):
+    """
+    List files of a local directory recursively as objects sorted by name the
+    way S3 sorts keys, i.e. a directory "a" sorts as "a/". Object names are
+    relative to path with "/" separator and prefixed by given prefix.
+
+    :param path: Local directory.
+    :param prefix: Prefix added to object names.
+    :return: Iterator of :class:`Object <Object>`.
+
+    Example::
+        for entry in diff(
+                list_local_objects("/data/photos", prefix="photos/"),
+                minio.list_objects("my-bucket", "photos/", recursive=True),
+        ):
+            print(entry.kind, entry.object_name)
+    """
+    return _walk(path, prefix)
@@ -25,8 +25,9 @@ import math
 import os
 import re
 import urllib.parse
-from queue import Queue
-from threading import BoundedSemaphore, Thread
+from collections import deque
+from queue import Full, Queue
+from threading import BoundedSemaphore, Event, Thread
 
 from .sse import Sse, SseCustomerKey
 
@@ -698,3 +699,95 @@ class ThreadPool:
         if not self._exceptions_queue.empty():
             raise self._exceptions_queue.get()
         return self._results_queue
+
+
+def _put(queue, item, stop):
+    """Put item into queue unless stop is set; return False if stopped."""
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _run_task(task, queue, stop):
+    """Put items of iterable returned by task into queue followed by end."""
+    try:
+        for item in task():
+            if not _put(queue, (False, item), stop):
+                return
+        _put(queue, (True, None), stop)
+    except Exception as exc:  # pylint: disable=broad-except
+        _put(queue, (True, exc), stop)
+
+
+def _iterate_ordered(start, num_workers, queue_size):
+    """Yield items of tasks in task order."""
+    queues = deque()
+    for _ in range(num_workers):
+        queue = Queue(queue_size)
+        if not start(queue):
+            break
+        queues.append(queue)
+    while queues:
+        done, item = queues[0].get()
+        if not done:
+            yield item
+            continue
+        if item is not None:
+            raise item
+        queues.popleft()
+        queue = Queue(queue_size)
+        if start(queue):
+            queues.append(queue)
+
+
+def _iterate_unordered(start, num_workers, queue_size):
+    """Yield items of tasks in order of arrival."""
+    queue = Queue(queue_size * num_workers)
+    running = 0
+    while running < num_workers and start(queue):
+        running += 1
+    while running:
+        done, item = queue.get()
+        if not done:
+            yield item
+            continue
+        if item is not None:
+            raise item
+        running -= 1
+        if start(queue):
+            running += 1
+
+
+def iterate_parallel(tasks, num_workers, ordered=False, queue_size=2):
+    """
+    Run tasks in up to num_workers threads and yield items of iterables
+    returned by each task. Tasks are callables taking no arguments; they are
+    started lazily as earlier tasks finish. If ordered is set, items are
+    yielded in task order, else in order of arrival. Each running task
+    buffers up to queue_size items. Exception raised by a task is re-raised
+    to the caller and remaining tasks are stopped.
+    """
+    if num_workers < 1:
+        raise ValueError("number of workers must be at least 1")
+
+    stop = Event()
+    tasks = iter(tasks)
+
+    def start(queue):
+        task = next(tasks, None)
+        if task is None:
+            return False
+        Thread(
+            target=_run_task, args=(task, queue, stop), daemon=True,
+        ).start()
+        return True
+
+    iterate = _iterate_ordered if ordered else _iterate_unordered
+    try:
+        yield from iterate(start, num_workers, queue_size)
+    finally:
+        stop.set()
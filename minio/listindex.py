@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage, (C)
+# 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local SQLite index of objects in a bucket."""
+
+from __future__ import absolute_import
+
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from urllib.parse import unquote_plus
+
+from .datatypes import Object
+from .time import from_iso8601utc
+
+_BATCH_SIZE = 1000
+
+# Greatest code point; its UTF-8 encoding sorts after any valid key suffix.
+_MAX_CHAR = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    name TEXT PRIMARY KEY,
+    size INTEGER,
+    last_modified REAL,
+    etag TEXT,
+    scan_id INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS objects_last_modified
+    ON objects (last_modified);
+CREATE INDEX IF NOT EXISTS objects_size ON objects (size);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO objects "
+    "(name, size, last_modified, etag, scan_id) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _to_timestamp(value):
+    """Convert datetime to POSIX timestamp."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _upper_bound(prefix):
+    """Get exclusive upper bound of names starting with prefix."""
+    return prefix + _MAX_CHAR
+
+
+class ListingIndex:
+    """
+    Local SQLite index of latest objects in a bucket.
+
+    The index is populated by :meth:`rescan` which lists the bucket
+    recursively, and is kept fresh by periodic rescans or by bucket
+    notification events applied by :meth:`listen` or :meth:`apply_event`.
+    :meth:`query` answers prefix, modification time and size queries
+    locally without contacting the server.
+
+    :param client: :class:`Minio <Minio>` object.
+    :param bucket_name: Name of the bucket.
+    :param filename: SQLite database file; defaults to in-memory database.
+
+    Example::
+        index = ListingIndex(minio, "my-bucketname", "/tmp/my-bucket.db")
+        index.rescan()
+        for obj in index.query(prefix="logs/", min_size=1024):
+            print(obj.object_name, obj.size)
+    """
+
+    def __init__(self, client, bucket_name, filename=":memory:"):
+        self._client = client
+        self._bucket_name = bucket_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._scan_id = self._conn.execute(
+                "SELECT COALESCE(MAX(scan_id), 0) FROM objects",
+            ).fetchone()[0]
+
+    @property
+    def bucket_name(self):
+        """Get bucket name."""
+        return self._bucket_name
+
+    def _write(self, rows, scan_id):
+        """Upsert rows of (name, size, last_modified, etag)."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                _UPSERT, [row + (scan_id,) for row in rows],
+            )
+
+    def rescan(self, prefix=None, start_after=None):
+        """
+        List objects after start_after under prefix and make the index match
+        the listing; entries in the scanned range which are not listed
+        anymore are removed.
+
+        :param prefix: Rescan objects starting with prefix.
+        :param start_after: Rescan objects after this key name.
+        :return: Number of objects listed.
+        """
+        with self._lock:
+            self._scan_id += 1
+            scan_id = self._scan_id
+
+        count = 0
+        rows = []
+        for obj in self._client.list_objects(
+                self._bucket_name, prefix=prefix, recursive=True,
+                start_after=start_after,
+        ):
+            rows.append(
+                (obj.object_name, obj.size, _to_timestamp(obj.last_modified),
+                 obj.etag),
+            )
+            if len(rows) >= _BATCH_SIZE:
+                self._write(rows, scan_id)
+                count += len(rows)
+                rows = []
+        self._write(rows, scan_id)
+        count += len(rows)
+
+        if start_after is not None and start_after >= (prefix or ""):
+            query = "DELETE FROM objects WHERE scan_id < ? AND name > ?"
+            args = [scan_id, start_after]
+        else:
+            query = "DELETE FROM objects WHERE scan_id < ? AND name >= ?"
+            args = [scan_id, prefix or ""]
+        if prefix:
+            query += " AND name < ?"
+            args.append(_upper_bound(prefix))
+        with self._lock, self._conn:
+            self._conn.execute(query, args)
+        return count
+
+    def apply_event(self, record):
+        """
+        Apply an event record of bucket notification to the index. Records of
+        other buckets and other than object created/removed events are
+        ignored.
+
+        :param record: Event record from listen_bucket_notification().
+        :return: True if the index is changed, False otherwise.
+        """
+        s3_info = record.get("s3") or {}
+        if (s3_info.get("bucket") or {}).get("name") != self._bucket_name:
+            return False
+        obj = s3_info.get("object") or {}
+        name = unquote_plus(obj.get("key") or "")
+        if not name:
+            return False
+
+        event_name = record.get("eventName") or ""
+        if event_name.startswith("s3:ObjectCreated:"):
+            etag = obj.get("eTag")
+            self._write(
+                [(name, obj.get("size"),
+                  _to_timestamp(from_iso8601utc(record.get("eventTime"))),
+                  etag.replace('"', "") if etag else etag)],
+                self._scan_id,
+            )
+            return True
+        if event_name.startswith("s3:ObjectRemoved:"):
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM objects WHERE name = ?", (name,),
+                )
+            return True
+        return False
+
+    def listen(self, prefix="", suffix=""):
+        """
+        Listen object created/removed events of the bucket and apply them to
+        the index. Caller should iterate returned iterator to keep applying
+        events; each applied event is yielded.
+
+        :param prefix: Listen events of object starts with prefix.
+        :param suffix: Listen events of object ends with suffix.
+        :return: Iterator of applied event records.
+        """
+        for event in self._client.listen_bucket_notification(
+                self._bucket_name, prefix=prefix, suffix=suffix,
+                events=("s3:ObjectCreated:*", "s3:ObjectRemoved:*"),
+        ):
+            for record in event.get("Records") or []:
+                if self.apply_event(record):
+                    yield record
+
+    def query(self, prefix=None, modified_after=None, min_size=None,
+              max_size=None):
+        """
+        Query objects from the index in name order.
+
+        :param prefix: Object name starts with prefix.
+        :param modified_after: Objects modified after this time.
+        :param min_size: Objects of size greater than or equal to this size.
+        :param max_size: Objects of size less than or equal to this size.
+        :return: List of :class:`Object <Object>`.
+        """
+        conditions = []
+        args = []
+        if prefix:
+            conditions.append("name >= ? AND name < ?")
+            args += [prefix, _upper_bound(prefix)]
+        if modified_after is not None:
+            conditions.append("last_modified > ?")
+            args.append(_to_timestamp(modified_after))
+        if min_size is not None:
+            conditions.append("size >= ?")
+            args.append(min_size)
+        if max_size is not None:
+            conditions.append("size <= ?")
+            args.append(max_size)
+        query = "SELECT name, size, last_modified, etag FROM objects"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY name"
+        with self._lock:
+            rows = self._conn.execute(query, args).fetchall()
+        return [
+            Object(
+                self._bucket_name, name, size=size, etag=etag,
+                last_modified=(
+                    None if last_modified is None
+                    else datetime.fromtimestamp(last_modified, timezone.utc)
+                ),
+            )
+            for name, size, last_modified, etag in rows
+        ]
+
+    def close(self):
+        """Close the index database."""
+        with self._lock:
+            self._conn.close()
@@ -29,4 +29,5 @@ __copyright__ = 'Copyright 2019 MinIO, Inc.'
 from .errors import SelectCRCValidationError, SelectMessageError
 from .helpers import (byte_int, calculate_crc,  # pylint: disable=unused-import
                       validate_crc)
-from .reader import SelectObjectReader  # pylint: disable=unused-import
+from .reader import (MultiSelectReader,  # pylint: disable=unused-import
+                     SelectObjectReader)
@@ -25,7 +25,6 @@ This module implements the helper functions for SelectObject responses.
 
 """
 
-import codecs
 from binascii import crc32
 
 EVENT_RECORDS = 'Records'  # Event Type is Records
@@ -56,4 +55,4 @@ def byte_int(data_bytes):
     '''
     Convert bytes to big-endian integer
     '''
-    return int(codecs.encode(data_bytes, 'hex'), 16)
+    return int.from_bytes(data_bytes, 'big')
@@ -27,13 +27,29 @@ This module implements the reader for SelectObject response body.
 
 from __future__ import absolute_import
 
-import io
-import sys
+import codecs
+import csv
+import itertools
+import json
+import operator
+import struct
+import threading
+from binascii import crc32
 from xml.etree import ElementTree
 
+from ..helpers import iterate_parallel
+from ..selectrequest import CSVOutputSerialization
 from .errors import SelectCRCValidationError, SelectMessageError
-from .helpers import (ERROR, EVENT, EVENT_CONTENT_TYPE, EVENT_RECORDS,
-                      EVENT_STATS, byte_int, calculate_crc, validate_crc)
+from .helpers import (ERROR, EVENT, EVENT_CONTENT_TYPE, EVENT_END,
+                      EVENT_PROGRESS, EVENT_RECORDS, EVENT_STATS)
+
+# Prelude is total length, headers length and CRC of both.
+_PRELUDE = struct.Struct(">III")
+_CRC = struct.Struct(">I")
+_UINT16 = struct.Struct(">H")
+_HEADER_VALUE_STRING = 7
+# Maximum number of distinct parsed headers remembered by a reader.
+_MAX_CACHED_HEADERS = 16
 
 
 def _extract_header(header_bytes):
@@ -41,35 +57,49 @@ def _extract_header(header_bytes):
     populates the header map after reading the header in bytes
     """
     header_map = {}
-    header_byte_parsed = 0
+    offset = 0
     # While loop ends when all the headers present are read
     # header contains multipe headers
-    while header_byte_parsed < len(header_bytes):
-        header_name_byte_length = byte_int(
-            header_bytes[header_byte_parsed:header_byte_parsed+1])
-        header_byte_parsed += 1
-        header_name = header_bytes[
-            header_byte_parsed:header_byte_parsed+header_name_byte_length
-        ]
-        header_byte_parsed += header_name_byte_length
-        # Header Value Type is of 1 bytes and is skipped
-        header_byte_parsed += 1
-        value_string_byte_length = byte_int(
-            header_bytes[header_byte_parsed:header_byte_parsed+2]
+    while offset < len(header_bytes):
+        name_length = header_bytes[offset]
+        offset += 1
+        name = bytes(header_bytes[offset:offset+name_length])
+        offset += name_length
+        if header_bytes[offset] != _HEADER_VALUE_STRING:
+            raise SelectMessageError(
+                "Unsupported header value type {0} of {1}".format(
+                    header_bytes[offset], name.decode("utf-8"),
+                ),
+            )
+        offset += 1
+        value_length, = _UINT16.unpack_from(header_bytes, offset)
+        offset += 2
+        value = bytes(header_bytes[offset:offset+value_length])
+        offset += value_length
+        header_map[name.decode("utf-8").lstrip(":")] = (
+            value.decode("utf-8").lstrip(":")
         )
-        header_byte_parsed += 2
-        header_value = header_bytes[
-            header_byte_parsed:header_byte_parsed+value_string_byte_length
-        ]
-        header_byte_parsed += value_string_byte_length
-        header_map[header_name.decode(
-            "utf-8").lstrip(":")] = header_value.decode("utf-8").lstrip(":")
     return header_map
 
 
+def _check_message_type(header_map):
+    """
+    Raise error for error message or unrecognized message type.
+    """
+    if header_map.get("message-type") == ERROR:
+        raise SelectMessageError(
+            header_map.get("error-code", "") + ":\"" +
+            header_map.get("error-message", "") + "\"")
+    if header_map.get("message-type") != EVENT:
+        raise SelectMessageError(
+            "Unrecognized message-type {0}".format(
+                header_map.get("message-type"))
+        )
+
+
 def _parse_stats(stats):
     """
-    Parses stats XML and populates the stat dict.
+    Parses stats or progress XML and populates the stat dict.
     """
     stat = {}
     for attribute in ElementTree.fromstring(stats):
@@ -83,18 +113,137 @@ def _parse_stats(stats):
     return stat
 
 
+def _split_records(chunks, delimiter, is_complete=None, marker=None):
+    """
+    Split text chunks into records by delimiter. If is_complete is given, a
+    record is joined with next one while is_complete() is false for it;
+    records of a chunk are checked only if the chunk has marker in it.
+    """
+    pending = ""
+    partial = None
+    for chunk in chunks:
+        text = pending + chunk
+        records = text.split(delimiter)
+        pending = records.pop()
+        if partial is None and (is_complete is None or marker not in text):
+            yield from records
+            continue
+        for record in records:
+            if partial is not None:
+                record = partial + delimiter + record
+                partial = None
+            if is_complete(record):
+                yield record
+            else:
+                partial = record
+    if partial is not None:
+        pending = partial + delimiter + pending
+    if pending:
+        yield pending
+
+
+def _is_quote_closed(record, quote, escape):
+    """
+    Check whether quoted fields of a CSV record are closed; a character
+    following escape character is skipped.
+    """
+    closed = True
+    position = 0
+    while True:
+        index = record.find(quote, position)
+        if index < 0:
+            return closed
+        escape_index = record.find(escape, position, index)
+        if escape_index >= 0:
+            position = escape_index + 2
+            continue
+        closed = not closed
+        position = index + 1
+
+
+def _csv_records(chunks, serialization):
+    """Parse CSV records to tuples of fields."""
+    quote = serialization.quote_character or '"'
+    escape = serialization.quote_escape_character or quote
+    records = _split_records(
+        chunks,
+        serialization.record_delimiter or "\n",
+        # Doubled quote toggles twice, hence counting is enough for it.
+        (lambda record: record.count(quote) % 2 == 0) if escape == quote
+        else lambda record: _is_quote_closed(record, quote, escape),
+        quote,
+    )
+    return map(tuple, csv.reader(
+        records,
+        delimiter=serialization.field_delimiter or ",",
+        quotechar=quote,
+        doublequote=escape == quote,
+        escapechar=None if escape == quote else escape,
+    ))
+
+
+def _json_records(chunks, serialization):
+    """Parse JSON records to dicts."""
+    def _is_complete(record):
+        try:
+            json.loads(record)
+        except ValueError:
+            return not record.strip()
+        return True
+
+    delimiter = serialization.record_delimiter or "\n"
+    # Delimiter other than whitespace may be in a string value.
+    records = (
+        _split_records(chunks, delimiter, _is_complete, '"')
+        if delimiter.strip() else _split_records(chunks, delimiter)
+    )
+    for record in records:
+        if record.strip():
+            yield json.loads(record)
+
+
+def _columns(rows):
+    """Convert rows of a batch to columns."""
+    if rows and isinstance(rows[0], dict):
+        keys = dict.fromkeys(itertools.chain.from_iterable(rows))
+        return {key: [row.get(key) for row in rows] for key in keys}
+    width = max(map(len, rows), default=0)
+    if min(map(len, rows), default=0) != width:
+        rows = [row + (None,) * (width - len(row)) for row in rows]
+    return [list(map(operator.itemgetter(i), rows)) for i in range(width)]
+
+
+def _batches(records, batch_size, columnar):
+    """Yield lists of records, or columns of them if columnar is set."""
+    while True:
+        batch = list(itertools.islice(records, batch_size))
+        if not batch:
+            break
+        yield _columns(batch) if columnar else batch
+
+
 class SelectObjectReader:
     """
     SelectObjectReader returns a Reader that upon read
     returns queried data, but stops when the response ends.
     LimitedRandomReader is compatible with BufferedIOBase.
+
+    If progress is given, it is called with event type and parsed
+    information as each Progress and Stats message arrives; an exception
+    raised by it closes the response and is re-raised to the caller.
     """
 
-    def __init__(self, response):
+    def __init__(self, response, output_serialization=None, progress=None):
         self.response = response
-        self.remaining_bytes = bytes()
+        self._output_serialization = output_serialization
+        self._progress_callback = progress
         self.stat = {}
         self.prog = {}
+        self._prelude = bytearray(_PRELUDE.size)
+        self._buffer = bytearray(64*1024)
+        self._payload = memoryview(b"")
+        self._done = False
+        self._headers = {}
 
     def readable(self):  # pylint: disable=no-self-use
         """Return this is readable."""
@@ -116,113 +265,285 @@ class SelectObjectReader:
         """Get progress information."""
         return self.prog
 
-    def __extract_message(self):
+    def _read_fully(self, view):
+        """Read response into view until it is full or response ends."""
+        offset = 0
+        while offset < len(view):
+            size = self.response.readinto(view[offset:])
+            if not size:
+                break
+            offset += size
+        return offset
+
+    def _read_message(self):
         """
-        Process the response sent from server.
+        Read a message from the response sent from server and return its
+        event type and payload; payload is a view of internal buffer valid
+        until next message is read. Event type is None at end of response.
         https://docs.aws.amazon.com/AmazonS3/latest/API/RESTObjectSELECTContent.html
         """
+        prelude = memoryview(self._prelude)
+        size = self._read_fully(prelude)
+        if not size:
+            return None, None
+        if size < len(prelude):
+            raise SelectMessageError(
+                "Premature truncation of select message prelude" +
+                ", server is sending corrupt message?")
 
-        crc_bytes = io.BytesIO()
-        total_bytes_len = self.response.read(4)
-        if not total_bytes_len:
-            return {}
-
-        total_length = byte_int(total_bytes_len)
-        header_bytes_len = self.response.read(4)
-        if not header_bytes_len:
-            return {}
-
-        header_len = byte_int(header_bytes_len)
+        total_length, header_length, prelude_crc = _PRELUDE.unpack(prelude)
+        crc = crc32(prelude[:8])
+        if crc != prelude_crc:
+            raise SelectCRCValidationError(
+                {"Checksum Mismatch, PreludeCRC of " + str(crc) +
+                 " does not equal expected CRC of " + str(prelude_crc)})
+        crc = crc32(prelude[8:], crc)
 
-        crc_bytes.write(total_bytes_len)
-        crc_bytes.write(header_bytes_len)
+        # Headers, payload and message CRC are read at once.
+        length = total_length - len(prelude)
+        if length < header_length + _CRC.size:
+            raise SelectMessageError(
+                "Invalid select message length {0}".format(total_length))
+        if len(self._buffer) < length:
+            # Allocate new buffer as views of old one may still exist.
+            self._buffer = bytearray(max(length, 2*len(self._buffer)))
+        message = memoryview(self._buffer)[:length]
+        if self._read_fully(message) < length:
+            raise SelectMessageError(
+                "Premature truncation of select message" +
+                ", server is sending corrupt message?")
 
-        prelude_bytes_crc = self.response.read(4)
-        if not validate_crc(crc_bytes.getvalue(), prelude_bytes_crc):
+        message_crc, = _CRC.unpack_from(message, length - _CRC.size)
+        crc = crc32(message[:length - _CRC.size], crc)
+        if crc != message_crc:
             raise SelectCRCValidationError(
-                {"Checksum Mismatch, PreludeCRC of " +
-                 str(calculate_crc(crc_bytes.getvalue())) +
-                 " does not equal expected CRC of " +
-                 str(byte_int(prelude_bytes_crc))})
-
-        crc_bytes.write(prelude_bytes_crc)
+                {"Checksum Mismatch, MessageCRC of " + str(crc) +
+                 " does not equal expected CRC of " + str(message_crc)})
+
+        # Messages of same event type carry identical headers.
+        header_bytes = bytes(message[:header_length])
+        header_map = self._headers.get(header_bytes)
+        if header_map is None:
+            header_map = _extract_header(header_bytes)
+            if len(self._headers) < _MAX_CACHED_HEADERS:
+                self._headers[header_bytes] = header_map
+        _check_message_type(header_map)
+
+        event_type = header_map.get("event-type")
+        payload = message[header_length:length - _CRC.size]
+        if event_type in (EVENT_STATS, EVENT_PROGRESS):
+            self._handle_progress(
+                event_type, header_map.get("content-type"), payload,
+            )
+        elif event_type == EVENT_END:
+            self._done = True
+        return event_type, payload
 
-        header_bytes = self.response.read(header_len)
-        if not header_bytes:
+    def _handle_progress(self, event_type, content_type, payload):
+        """Parse payload of Progress or Stats message and report it."""
+        if content_type != EVENT_CONTENT_TYPE:
             raise SelectMessageError(
-                "Premature truncation of select message header" +
-                ", server is sending corrupt message?")
+                "Unrecognized content-type {0}".format(content_type))
+        info = _parse_stats(bytes(payload))
+        if event_type == EVENT_STATS:
+            self.stat = info
+        else:
+            self.prog = info
+        if self._progress_callback is not None:
+            try:
+                self._progress_callback(event_type, info)
+            except Exception:
+                self.close()
+                raise
+
+    def _next_records(self):
+        """Get payload of next Records message; None at end of response."""
+        while not self._done and not self.response.isclosed():
+            event_type, payload = self._read_message()
+            if event_type is None:
+                self._done = True
+            elif event_type == EVENT_RECORDS and payload:
+                return payload
+        return None
+
+    def _stream(self, num_bytes):
+        """Yield views of record payloads up to num_bytes each."""
+        while True:
+            if not self._payload:
+                payload = self._next_records()
+                if payload is None:
+                    break
+                self._payload = payload
+
+            result = self._payload[:num_bytes]
+            self._payload = self._payload[num_bytes:]
+            yield result
+
+    def stream_bytes(self, num_bytes=32*1024):
+        """
+        extract records from the response body as raw bytes of up to
+        num_bytes each without decoding them; rest is buffered and sent in
+        the next iteration.
 
-        crc_bytes.write(header_bytes)
+        caller should call self.close() to close the stream.
+        """
+        for result in self._stream(num_bytes):
+            yield bytes(result)
+
+    def stream(self, num_bytes=32*1024):
+        """
+        extract each record from the response body ... and buffer it.
+        send only up to requested bytes such as message[:num_bytes]
+        rest is buffered and added to the next iteration. Records are
+        decoded as UTF-8 incrementally, hence a character split across
+        num_bytes boundary is sent in the next iteration.
 
-        header_map = _extract_header(header_bytes)
-        payload_length = total_length - header_len - int(16)
-        payload_bytes = b''
-        event_type = header_map["event-type"]
+        caller should call self.close() to close the stream.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        for result in self._stream(num_bytes):
+            result = decoder.decode(result)
+            if result:
+                yield result
 
-        if header_map["message-type"] == ERROR:
-            raise SelectMessageError(
-                header_map["error-code"] + ":\"" +
-                header_map["error-message"] + "\"")
+    def records(self, num_bytes=32*1024):
+        """
+        extract records from the response body parsed as per output
+        serialization of the request; a CSV record is a tuple of fields
+        and a JSON record is a dict. Records split across messages are
+        reassembled.
 
-        if header_map["message-type"] != EVENT:
-            raise SelectMessageError(
-                "Unrecognized message-type {0}".format(
-                    header_map["message-type"])
+        caller should call self.close() to close the stream.
+        """
+        if self._output_serialization is None:
+            raise ValueError(
+                "output serialization of the request is unknown",
+            )
+        if isinstance(self._output_serialization, CSVOutputSerialization):
+            return _csv_records(
+                self.stream(num_bytes), self._output_serialization,
             )
+        return _json_records(
+            self.stream(num_bytes), self._output_serialization,
+        )
 
-        if event_type == EVENT_STATS:
-            content_type = header_map["content-type"]
-            if content_type != EVENT_CONTENT_TYPE:
-                raise SelectMessageError(
-                    "Unrecognized content-type {0}".format(content_type))
+    def record_batches(self, batch_size=1000, columnar=False):
+        """
+        extract records as lists of up to batch_size records. If columnar is
+        set, each CSV batch is a list of columns and each JSON batch is a
+        dict of key and column; a column is a list of values having None for
+        a missing value.
 
-            payload_bytes = self.response.read(payload_length)
-            self.stat = _parse_stats(payload_bytes)
-        elif event_type == EVENT_RECORDS:
-            payload_bytes = self.response.read(payload_length)
+        caller should call self.close() to close the stream.
+        """
+        if batch_size < 1:
+            raise ValueError("batch size must be greater than zero")
+        return _batches(self.records(), batch_size, columnar)
 
-        crc_bytes.write(payload_bytes)
 
-        message_crc = self.response.read(4)
-        if not message_crc:
-            return {}
+class MultiSelectReader:
+    """
+    MultiSelectReader runs several select requests concurrently and merges
+    their parsed records; stats are summed over finished requests and
+    progress over all requests. Requests are given as pairs of a key
+    identifying the request and a callable taking a progress callback and
+    returning :class:`SelectObjectReader <SelectObjectReader>`.
+
+    If progress is given, it is called with event type and summed
+    information as each Progress and Stats message of any request arrives;
+    calls are serialized but made from worker threads.
+    """
 
-        if not validate_crc(crc_bytes.getvalue(), message_crc):
-            raise SelectCRCValidationError(
-                {"Checksum Mismatch, MessageCRC of " +
-                 str(calculate_crc(crc_bytes.getvalue())) +
-                 " does not equal expected CRC of " +
-                 str(byte_int(message_crc))})
+    def __init__(self, openers, num_workers=4, ordered=True,
+                 batch_size=1000, progress=None):
+        self._openers = openers
+        self._num_workers = num_workers
+        self._ordered = ordered
+        self._batch_size = batch_size
+        self._progress_callback = progress
+        self._lock = threading.RLock()
+        self._readers = set()
+        self.stat = {}
+        self.prog = {}
 
-        message = {event_type: payload_bytes}
-        return message
+    def close(self):
+        """Close responses of running requests."""
+        with self._lock:
+            readers = list(self._readers)
+        for reader in readers:
+            reader.close()
 
-    def stream(self, num_bytes=32*1024):
-        """
-        extract each record from the response body ... and buffer it.
-        send only up to requested bytes such as message[:num_bytes]
-        rest is buffered and added to the next iteration.
+    def stats(self):
+        """Get stats information summed over finished requests."""
+        return self.stat
 
-        caller should call self.close() to close the stream.
+    def progress(self):
+        """Get progress information."""
+        return self.prog
+
+    def _update(self, last, event_type, info):
+        """Add information of a request to totals; last is its previous."""
+        with self._lock:
+            # Stats of a request is its final progress.
+            for name, value in info.items():
+                self.prog[name] = str(
+                    int(self.prog.get(name, 0)) + int(value) -
+                    int(last.get(name, 0)),
+                )
+            last.update(info)
+            if event_type == EVENT_STATS:
+                for name, value in info.items():
+                    self.stat[name] = str(
+                        int(self.stat.get(name, 0)) + int(value),
+                    )
+            if self._progress_callback is not None:
+                self._progress_callback(
+                    event_type,
+                    dict(self.stat if event_type == EVENT_STATS
+                         else self.prog),
+                )
+
+    def _read(self, key, opener):
+        """Open a select request and yield batches of its records."""
+        last = {}
+        reader = opener(
+            lambda event_type, info: self._update(last, event_type, info),
+        )
+        with self._lock:
+            self._readers.add(reader)
+        try:
+            for batch in reader.record_batches(self._batch_size):
+                yield key, batch
+        finally:
+            reader.close()
+            with self._lock:
+                self._readers.discard(reader)
+
+    def _batches(self):
+        """Yield pairs of key and batch of records of all requests."""
+        return iterate_parallel(
+            (lambda key=key, opener=opener: self._read(key, opener)
+             for key, opener in self._openers),
+            self._num_workers,
+            ordered=self._ordered,
+        )
+
+    def records(self):
         """
-        while not self.response.isclosed():
-            if not self.remaining_bytes:
-                message = self.__extract_message()
-                if EVENT_RECORDS not in message:
-                    continue
+        extract records of all requests; records of each request are in
+        its order, and requests are in given order if ordered is set.
 
-                self.remaining_bytes = message.get(EVENT_RECORDS, b'')
+        caller should call self.close() to close the streams.
+        """
+        for _, batch in self._batches():
+            yield from batch
 
-            result = self.remaining_bytes
-            if num_bytes < len(self.remaining_bytes):
-                result = self.remaining_bytes[:num_bytes]
-            self.remaining_bytes = self.remaining_bytes[len(result):]
+    def keyed_records(self):
+        """
+        extract records of all requests as pairs of request key and record.
 
-            if result == b'':
-                break
-            if sys.version_info.major == 3:
-                yield result.decode('utf-8', errors='ignore')
-            else:
-                # Python 2.x needs explicit conversion.
-                yield result.decode('utf-8', errors='ignore').encode('utf-8')
+        caller should call self.close() to close the streams.
+        """
+        for key, batch in self._batches():
+            for record in batch:
+                yield key, record
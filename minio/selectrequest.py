@@ -60,10 +60,15 @@ class InputSerialization:
             )
         self._compression_type = compression_type
 
+    @property
+    def compression_type(self):
+        """Get compression type."""
+        return self._compression_type
+
     def toxml(self, element):
         """Convert to XML."""
         if self._compression_type is not None:
-            SubElement(element, "CompressionType")
+            SubElement(element, "CompressionType", self._compression_type)
         return element
 
 
@@ -143,6 +148,11 @@ class JSONInputSerialization(InputSerialization):
             )
         self._json_type = json_type
 
+    @property
+    def json_type(self):
+        """Get JSON type."""
+        return self._json_type
+
     def toxml(self, element):
         """Convert to XML."""
         super().toxml(element)
@@ -186,6 +196,26 @@ class CSVOutputSerialization:
         self._quote_fields = quote_fields
         self._record_delimiter = record_delimiter
 
+    @property
+    def field_delimiter(self):
+        """Get field delimiter."""
+        return self._field_delimiter
+
+    @property
+    def quote_character(self):
+        """Get quote character."""
+        return self._quote_character
+
+    @property
+    def quote_escape_character(self):
+        """Get quote escape character."""
+        return self._quote_escape_character
+
+    @property
+    def record_delimiter(self):
+        """Get record delimiter."""
+        return self._record_delimiter
+
     def toxml(self, element):
         """Convert to XML."""
         element = SubElement(element, "CSV")
@@ -211,6 +241,11 @@ class JSONOutputSerialization:
     def __init__(self, record_delimiter=None):
         self._record_delimiter = record_delimiter
 
+    @property
+    def record_delimiter(self):
+        """Get record delimiter."""
+        return self._record_delimiter
+
     def toxml(self, element):
         """Convert to XML."""
         element = SubElement(element, "JSON")
@@ -251,6 +286,36 @@ class SelectRequest:
         self._scan_start_range = scan_start_range
         self._scan_end_range = scan_end_range
 
+    @property
+    def expression(self):
+        """Get SQL expression."""
+        return self._expession
+
+    @property
+    def input_serialization(self):
+        """Get input serialization."""
+        return self._input_serialization
+
+    @property
+    def output_serialization(self):
+        """Get output serialization."""
+        return self._output_serialization
+
+    @property
+    def request_progress(self):
+        """Get request progress flag."""
+        return self._request_progress
+
+    @property
+    def scan_start_range(self):
+        """Get scan start range."""
+        return self._scan_start_range
+
+    @property
+    def scan_end_range(self):
+        """Get scan end range."""
+        return self._scan_end_range
+
     def toxml(self, element):
         """Convert to XML."""
         element = Element("SelectObjectContentRequest")
@@ -266,10 +331,13 @@ class SelectRequest:
             SubElement(
                 SubElement(element, "RequestProgress"), "Enabled", "true",
             )
-        if self._scan_start_range or self._scan_end_range:
+        if (
+                self._scan_start_range is not None or
+                self._scan_end_range is not None
+        ):
             tag = SubElement(element, "ScanRange")
-            if self._scan_start_range:
-                SubElement(tag, "Start", self._scan_start_range)
-            if self._scan_end_range:
-                SubElement(tag, "End", self._scan_end_range)
+            if self._scan_start_range is not None:
+                SubElement(tag, "Start", str(self._scan_start_range))
+            if self._scan_end_range is not None:
+                SubElement(tag, "End", str(self._scan_end_range))
         return element
@@ -18,24 +18,21 @@
 
 from __future__ import absolute_import
 
-import locale
-from contextlib import contextmanager
 from datetime import datetime, timezone
-
-from . import __LOCALE_LOCK__
-
+from email.utils import parsedate_to_datetime
+
+_WEEK_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+_MONTH_NUMBERS = {name: index + 1 for index, name in enumerate(_MONTHS)}
 _HTTP_HEADER_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
-
-
-@contextmanager
-def _set_locale(name):
-    """Thread-safe wrapper to locale.setlocale()."""
-    with __LOCALE_LOCK__:
-        saved = locale.setlocale(locale.LC_ALL)
-        try:
-            yield locale.setlocale(locale.LC_ALL, name)
-        finally:
-            locale.setlocale(locale.LC_ALL, saved)
+# Positions and characters of separators in fixed layout time strings.
+_ISO_TIME_SEPARATORS = ((4, "-"), (7, "-"), (10, "T"), (13, ":"), (16, ":"))
+_HTTP_HEADER_SEPARATORS = (
+    (3, ","), (4, " "), (7, " "), (11, " "), (16, " "), (19, ":"), (22, ":"),
+)
 
 
 def _to_utc(value):
@@ -46,11 +43,50 @@ def _to_utc(value):
     )
 
 
+def _has_separators(value, separators):
+    """Check whether value has separators at their positions."""
+    return all(value[index] == char for index, char in separators)
+
+
+def _parse_iso8601utc(value):
+    """
+    Parse "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" by fixed offsets; return None if
+    value is not in that layout.
+    """
+    if (
+            len(value) < 20 or value[-1] != "Z" or
+            not _has_separators(value, _ISO_TIME_SEPARATORS) or
+            not value[:4].isdigit()
+    ):
+        return None
+    microsecond = 0
+    if len(value) > 20:
+        fraction = value[20:-1]
+        if (
+                value[19] != "." or len(fraction) > 6 or
+                not fraction.isdigit()
+        ):
+            return None
+        microsecond = int(fraction.ljust(6, "0"))
+    try:
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            microsecond, tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
 def from_iso8601utc(value):
     """Parse UTC ISO-8601 formatted string to datetime."""
     if value is None:
         return None
 
+    time = _parse_iso8601utc(value)
+    if time is not None:
+        return time
+
     try:
         time = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
     except ValueError:
@@ -64,28 +100,93 @@ def to_iso8601utc(value):
         return None
 
     value = _to_utc(value)
-    return (
-        value.strftime("%Y-%m-%dT%H:%M:%S.") + value.strftime("%f")[:3] + "Z"
+    return "{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}:{5:02d}.{6:03d}Z".format(
+        value.year, value.month, value.day,
+        value.hour, value.minute, value.second, value.microsecond // 1000,
+    )
+
+
+def _parse_http_header(value):
+    """
+    Parse "Www, DD Mmm YYYY HH:MM:SS GMT" by fixed offsets; return None if
+    value is not in that layout.
+    """
+    month = _MONTH_NUMBERS.get(value[8:11]) if len(value) == 29 else None
+    if (
+            month is None or value[:3] not in _WEEK_DAYS or
+            value[25:] != " GMT" or
+            not _has_separators(value, _HTTP_HEADER_SEPARATORS)
+    ):
+        return None
+    fields = (
+        value[5:7], value[12:16], value[17:19], value[20:22], value[23:25],
     )
+    if not all(field.isdigit() for field in fields):
+        return None
+    try:
+        return datetime(
+            int(value[12:16]), month, int(value[5:7]),
+            int(value[17:19]), int(value[20:22]), int(value[23:25]),
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
+def _parse_http_header_lenient(value):
+    """
+    Parse HTTP header date with unpadded fields or other letter case of
+    names; return None if value is not a valid HTTP header date.
+    """
+    parts = value.split()
+    if (
+            len(parts) != 6 or parts[0][:-1].title() not in _WEEK_DAYS or
+            not parts[0].endswith(",") or parts[5] != "GMT"
+    ):
+        return None
+    clock = parts[4].split(":")
+    if (
+            len(parts[3]) != 4 or len(clock) != 3 or
+            not all(field.isdigit() for field in [parts[1], parts[3]] + clock)
+    ):
+        return None
+    try:
+        time = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return time.replace(tzinfo=timezone.utc)
 
 
 def from_http_header(value):
     """Parse HTTP header date formatted string to datetime."""
-    with _set_locale("C"):
-        return datetime.strptime(
-            value, _HTTP_HEADER_FORMAT,
-        ).replace(tzinfo=timezone.utc)
+    time = _parse_http_header(value)
+    if time is None:
+        time = _parse_http_header_lenient(value)
+    if time is None:
+        raise ValueError(
+            "time data {0!r} does not match format {1!r}".format(
+                value, _HTTP_HEADER_FORMAT,
+            ),
+        )
+    return time
 
 
 def to_http_header(value):
     """Format datatime into HTTP header date formatted string."""
-    with _set_locale("C"):
-        return _to_utc(value).strftime(_HTTP_HEADER_FORMAT)
+    value = _to_utc(value)
+    return "{0}, {1:02d} {2} {3:04d} {4:02d}:{5:02d}:{6:02d} GMT".format(
+        _WEEK_DAYS[value.weekday()], value.day, _MONTHS[value.month - 1],
+        value.year, value.hour, value.minute, value.second,
+    )
 
 
 def to_amz_date(value):
     """Format datetime into AMZ date formatted string."""
-    return _to_utc(value).strftime("%Y%m%dT%H%M%SZ")
+    value = _to_utc(value)
+    return "{0:04d}{1:02d}{2:02d}T{3:02d}{4:02d}{5:02d}Z".format(
+        value.year, value.month, value.day,
+        value.hour, value.minute, value.second,
+    )
 
 
 def utcnow():
@@ -95,4 +196,5 @@ def utcnow():
 
 def to_signer_date(value):
     """Format datetime into SignatureV4 date formatted string."""
-    return _to_utc(value).strftime("%Y%m%d")
+    value = _to_utc(value)
+    return "{0:04d}{1:02d}{2:02d}".format(value.year, value.month, value.day)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import timedelta
+from unittest import TestCase
+
+import mock
+from nose.tools import eq_
+
+from minio import Minio
+from minio.api import _DEFAULT_USER_AGENT
+from minio.time import to_iso8601utc, utcnow
+
+from .minio_mocks import MockConnection, MockResponse
+
+_UPLOADS = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListMultipartUploadsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Bucket>bucket</Bucket>
+  <NextKeyMarker>{0}</NextKeyMarker>
+  <NextUploadIdMarker>{1}</NextUploadIdMarker>
+  <IsTruncated>{2}</IsTruncated>
+  <Upload>
+    <Key>{0}</Key>
+    <UploadId>{1}</UploadId>
+    <Initiated>{3}</Initiated>
+  </Upload>
+</ListMultipartUploadsResult>'''
+
+_PARTS = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListPartsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Bucket>bucket</Bucket>
+  <Key>{0}</Key>
+  <UploadId>{1}</UploadId>
+  <IsTruncated>false</IsTruncated>
+  <Part><PartNumber>1</PartNumber><ETag>"a"</ETag><Size>100</Size></Part>
+  <Part><PartNumber>2</PartNumber><ETag>"b"</ETag><Size>50</Size></Part>
+</ListPartsResult>'''
+
+_NO_SUCH_UPLOAD = (
+    "<Error><Code>NoSuchUpload</Code><Message>No such upload</Message>"
+    "<RequestId>1</RequestId><HostId>2</HostId><Resource>/r</Resource>"
+    "</Error>"
+)
+
+
+def _uploads_response(key, upload_id, truncated, age, marker="",
+                      upload_id_marker=""):
+    return MockResponse(
+        "GET",
+        "https://localhost:9000/bucket?delimiter=&encoding-type=url"
+        + marker + "&max-uploads=1000&prefix=" + upload_id_marker +
+        "&uploads=",
+        {"User-Agent": _DEFAULT_USER_AGENT},
+        200,
+        content=_UPLOADS.format(
+            key, upload_id, truncated, to_iso8601utc(utcnow() - age),
+        ).encode(),
+    )
+
+
+class AbortIncompleteUploadsTest(TestCase):
+    @mock.patch('urllib3.PoolManager')
+    def test_abort_stale_uploads(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            _uploads_response("a", "id1", "true", timedelta(days=2)),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket/a?max-parts=1000&uploadId=id1",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=_PARTS.format("a", "id1").encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "DELETE",
+                "https://localhost:9000/bucket/a?uploadId=id1",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                204,
+            ),
+        )
+        mock_server.mock_add_request(
+            _uploads_response(
+                "b", "id2", "false", timedelta(hours=1),
+                marker="&key-marker=a",
+                upload_id_marker="&upload-id-marker=id1",
+            ),
+        )
+        client = Minio('localhost:9000')
+        aborted = list(
+            client.abort_incomplete_uploads('bucket', num_workers=1),
+        )
+        eq_(
+            [(upload.object_name, upload.upload_id, upload.part_count,
+              upload.size) for upload in aborted],
+            [("a", "id1", 2, 150)],
+        )
+
+    @mock.patch('urllib3.PoolManager')
+    def test_skip_no_such_upload(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            _uploads_response("a", "id1", "false", timedelta(days=2)),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket/a?max-parts=1000&uploadId=id1",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                404,
+                response_headers={"Content-Type": "application/xml"},
+                content=_NO_SUCH_UPLOAD.encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        eq_(list(client.abort_incomplete_uploads('bucket')), [])
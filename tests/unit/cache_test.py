@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase
+
+import mock
+from nose.tools import eq_, raises
+
+from minio.cache import ContentCache, RegionCache, StatCache
+
+
+class RegionCacheTest(TestCase):
+    def test_get_set_pop(self):
+        cache = RegionCache()
+        eq_(cache.get("bucket"), None)
+        cache.set("bucket", "us-west-1")
+        eq_(cache.get("bucket"), "us-west-1")
+        eq_(cache.pop("bucket"), "us-west-1")
+        eq_(cache.get("bucket"), None)
+
+    def test_ttl(self):
+        cache = RegionCache(ttl=10)
+        with mock.patch("time.time", return_value=1000.0):
+            cache.set("bucket", "us-west-1")
+        with mock.patch("time.time", return_value=1005.0):
+            eq_(cache.get("bucket"), "us-west-1")
+        with mock.patch("time.time", return_value=1011.0):
+            eq_(cache.get("bucket"), None)
+
+    @raises(ValueError)
+    def test_invalid_ttl(self):
+        RegionCache(ttl=0)
+
+    def test_single_flight(self):
+        cache = RegionCache()
+        calls = []
+        started = threading.Event()
+
+        def fetch(bucket_name):
+            calls.append(bucket_name)
+            started.set()
+            time.sleep(0.1)
+            return "eu-west-1"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get("bucket", fetch)),
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        eq_(calls, ["bucket"])
+        eq_(results, ["eu-west-1"] * 8)
+
+    def test_fetch_failure_is_retried(self):
+        cache = RegionCache()
+
+        def fail(_):
+            raise ValueError("failed")
+
+        self.assertRaises(ValueError, cache.get, "bucket", fail)
+        eq_(cache.get("bucket", lambda _: "us-east-1"), "us-east-1")
+
+    def test_shared_file(self):
+        tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(tmpdir, "regions.json")
+        RegionCache(filename=filename).set("bucket", "ap-south-1")
+        cache = RegionCache(filename=filename)
+        eq_(cache.get("bucket", lambda _: "us-east-1"), "ap-south-1")
+        cache.pop("bucket")
+        eq_(RegionCache(filename=filename).get("bucket"), None)
+
+    def test_shared_file_concurrent_writers(self):
+        tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(tmpdir, "regions.json")
+
+        def _write(index):
+            # Separate instances share nothing but the file.
+            cache = RegionCache(filename=filename)
+            for number in range(20):
+                cache.set("bucket-{0}-{1}".format(index, number), "us-east-1")
+
+        threads = [
+            threading.Thread(target=_write, args=(index,))
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache = RegionCache(filename=filename)
+        for index in range(4):
+            for number in range(20):
+                eq_(
+                    cache.get("bucket-{0}-{1}".format(index, number)),
+                    "us-east-1",
+                )
+
+
+class StatCacheTest(TestCase):
+    def test_lru(self):
+        cache = StatCache(max_entries=2)
+        cache.set("bucket", "a", "obj-a")
+        cache.set("bucket", "b", "obj-b")
+        eq_(cache.get("bucket", "a"), ("obj-a", True))
+        cache.set("bucket", "c", "obj-c")
+        eq_(cache.get("bucket", "b"), (None, False))
+        eq_(cache.get("bucket", "a"), ("obj-a", True))
+        eq_(cache.get("bucket", "c"), ("obj-c", True))
+
+    def test_ttl_and_revalidate(self):
+        for revalidate, expected in ((False, None), (True, "obj")):
+            cache = StatCache(ttl=10, revalidate=revalidate)
+            with mock.patch("time.time", return_value=1000.0):
+                cache.set("bucket", "a", "obj", version_id="v1")
+            with mock.patch("time.time", return_value=1005.0):
+                eq_(cache.get("bucket", "a", "v1"), ("obj", True))
+                eq_(cache.get("bucket", "a"), (None, False))
+            with mock.patch("time.time", return_value=1011.0):
+                eq_(cache.get("bucket", "a", "v1"), (expected, False))
+
+    def test_invalidate(self):
+        cache = StatCache()
+        cache.set("bucket", "a", "obj")
+        cache.set("bucket", "a", "obj-v1", version_id="v1")
+        cache.invalidate("bucket", "a")
+        eq_(cache.get("bucket", "a"), (None, False))
+        eq_(cache.get("bucket", "a", "v1"), (None, False))
+
+    @raises(ValueError)
+    def test_invalid_max_entries(self):
+        StatCache(max_entries=0)
+
+
+class ContentCacheTest(TestCase):
+    def test_get_put(self):
+        cache = ContentCache(tempfile.mkdtemp())
+        eq_(cache.get("bucket", "a"), (None, None))
+        path = cache.put("bucket", "a", "etag1", [b"hello", b" world"])
+        eq_(cache.get("bucket", "a"), (path, "etag1"))
+        with open(path, "rb") as data_file:
+            eq_(data_file.read(), b"hello world")
+        eq_(cache.get("bucket", "a", "v1"), (None, None))
+
+    def test_evict(self):
+        cache = ContentCache(tempfile.mkdtemp(), max_size=10)
+        path_a = cache.put("bucket", "a", "etag", [b"123456"])
+        os.utime(path_a, (1, 1))
+        path_b = cache.put("bucket", "b", "etag", [b"123456"])
+        eq_(cache.get("bucket", "a"), (None, None))
+        eq_(cache.get("bucket", "b"), (path_b, "etag"))
@@ -16,6 +16,9 @@
 
 import json
 import os
+import shutil
+import tempfile
+import time
 from datetime import datetime, timedelta
 from unittest import TestCase
 
@@ -26,8 +29,9 @@ from minio.credentials.credentials import Credentials
 from minio.credentials.providers import (AWSConfigProvider, ChainedProvider,
                                          EnvAWSProvider, EnvMinioProvider,
                                          IamAwsProvider,
-                                         MinioClientConfigProvider,
-                                         StaticProvider)
+                                         MinioClientConfigProvider, Provider,
+                                         RefreshingProvider,
+                                         SharedCacheProvider, StaticProvider)
 
 CONFIG_JSON_SAMPLE = "tests/unit/config.json.sample"
 CREDENTIALS_SAMPLE = "tests/unit/credentials.sample"
@@ -188,6 +192,24 @@ class AWSConfigProviderTest(TestCase):
         except ValueError:
             pass
 
+    def test_file_aws_cached(self):
+        os.environ.clear()
+        filename = os.path.join(tempfile.mkdtemp(), "credentials")
+        shutil.copy(CREDENTIALS_SAMPLE, filename)
+        provider = AWSConfigProvider(filename)
+        creds = provider.retrieve()
+        with mock.patch("configparser.ConfigParser") as mock_parser:
+            eq_(provider.retrieve(), creds)
+            eq_(mock_parser.call_count, 0)
+        with open(filename, "w") as file:
+            file.write(
+                "[default]\naws_access_key_id = newKey\n"
+                "aws_secret_access_key = newSecret\n",
+            )
+        creds = provider.retrieve()
+        eq_(creds.access_key, "newKey")
+        eq_(creds.secret_key, "newSecret")
+
 
 class MinioClientConfigProviderTest(TestCase):
     def test_file_minio_(self):
@@ -218,6 +240,22 @@ class MinioClientConfigProviderTest(TestCase):
         eq_(creds.secret_key, "zuf+tfteSlswRu7BJ86wekitnifILbZam1KYY3TG")
         eq_(creds.session_token, None)
 
+    def test_file_minio_cached(self):
+        os.environ.clear()
+        filename = os.path.join(tempfile.mkdtemp(), "config.json")
+        shutil.copy(CONFIG_JSON_SAMPLE, filename)
+        provider = MinioClientConfigProvider(filename=filename, alias="play")
+        creds = provider.retrieve()
+        with mock.patch("json.load") as mock_load:
+            eq_(provider.retrieve(), creds)
+            eq_(mock_load.call_count, 0)
+        with open(filename, "w") as file:
+            json.dump(
+                {"hosts": {"play": {"accessKey": "new", "secretKey": "key"}}},
+                file,
+            )
+        eq_(provider.retrieve().access_key, "new")
+
 
 class StaticProviderTest(TestCase):
     def test_static_credentials(self):
@@ -226,3 +264,91 @@ class StaticProviderTest(TestCase):
         eq_(creds.access_key, "UXHW")
         eq_(creds.secret_key, "SECRET")
         eq_(creds.session_token, None)
+
+
+class CountingProvider(Provider):
+    def __init__(self, lifetime):
+        self.count = 0
+        self.lifetime = lifetime
+
+    def retrieve(self):
+        self.count += 1
+        return Credentials(
+            "access" + str(self.count),
+            "secret",
+            expiration=(
+                datetime.utcnow() + self.lifetime +
+                timedelta(seconds=self.count)
+            ),
+        )
+
+
+class RefreshingProviderTest(TestCase):
+    def test_cached(self):
+        wrapped = CountingProvider(timedelta(hours=1))
+        provider = RefreshingProvider(wrapped)
+        eq_(provider.retrieve().access_key, "access1")
+        eq_(provider.retrieve().access_key, "access1")
+        eq_(wrapped.count, 1)
+
+    def test_background_refresh(self):
+        wrapped = CountingProvider(timedelta(hours=1))
+        provider = RefreshingProvider(wrapped)
+        creds = provider.retrieve()
+        # Simulate reaching refresh time before expiry.
+        provider._state = (creds, time.time() - 1)
+        eq_(provider.retrieve().access_key, "access1")
+        for _ in range(100):
+            if not provider._refreshing:
+                break
+            time.sleep(0.01)
+        eq_(provider.retrieve().access_key, "access2")
+        eq_(wrapped.count, 2)
+
+    def test_expired(self):
+        wrapped = CountingProvider(timedelta(seconds=5))
+        provider = RefreshingProvider(wrapped)
+        eq_(provider.retrieve().access_key, "access1")
+        # Credentials expiring within 10 seconds are refreshed synchronously.
+        eq_(provider.retrieve().access_key, "access2")
+
+    @raises(ValueError)
+    def test_invalid_provider(self):
+        RefreshingProvider(None)
+
+
+class SharedCacheProviderTest(TestCase):
+    def test_shared(self):
+        filename = os.path.join(tempfile.mkdtemp(), "credentials.json")
+        wrapped = CountingProvider(timedelta(hours=1))
+        first = SharedCacheProvider(wrapped, filename)
+        second = SharedCacheProvider(wrapped, filename)
+        eq_(first.retrieve().access_key, "access1")
+        creds = second.retrieve()
+        eq_(creds.access_key, "access1")
+        eq_(creds.session_token, None)
+        eq_(wrapped.count, 1)
+        eq_(os.stat(filename).st_mode & 0o777, 0o600)
+
+    def test_existing_file_mode(self):
+        filename = os.path.join(tempfile.mkdtemp(), "credentials.json")
+        with open(filename, "w"):
+            pass
+        os.chmod(filename, 0o644)
+        provider = SharedCacheProvider(
+            CountingProvider(timedelta(hours=1)), filename,
+        )
+        eq_(provider.retrieve().access_key, "access1")
+        eq_(os.stat(filename).st_mode & 0o777, 0o600)
+
+    def test_refresh_once(self):
+        filename = os.path.join(tempfile.mkdtemp(), "credentials.json")
+        wrapped = CountingProvider(timedelta(hours=1))
+        first = SharedCacheProvider(wrapped, filename)
+        second = SharedCacheProvider(wrapped, filename)
+        first.retrieve()
+        second.retrieve()
+        eq_(first.refresh().access_key, "access2")
+        # Credentials refreshed by first are reused by second.
+        eq_(second.refresh().access_key, "access2")
+        eq_(wrapped.count, 2)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from nose.tools import eq_, raises
+
+from minio.datatypes import Object
+from minio.diff import ADDED, CHANGED, REMOVED, diff, list_local_objects
+
+
+def _objects(*entries):
+    return [
+        Object("bucket", name, size=size, etag=etag)
+        for name, size, etag in entries
+    ]
+
+
+class DiffTest(TestCase):
+    def test_diff(self):
+        old = _objects(
+            ("a", 1, "e1"), ("b", 2, "e2"), ("c", 3, "e3"), ("e", 5, "e5"),
+        )
+        new = _objects(
+            ("b", 2, "e2"), ("c", 3, "x3"), ("d", 4, "e4"), ("e", 6, "e5"),
+        )
+        for prefetch in (0, 2):
+            eq_(
+                [(entry.kind, entry.object_name)
+                 for entry in diff(old, new, prefetch=prefetch)],
+                [(REMOVED, "a"), (CHANGED, "c"), (ADDED, "d"),
+                 (CHANGED, "e")],
+            )
+        eq_(
+            [entry.object_name
+             for entry in diff(old, new, compare_etag=False)],
+            ["a", "d", "e"],
+        )
+
+    @raises(ValueError)
+    def test_unsorted(self):
+        list(diff(_objects(("b", 1, None), ("a", 1, None)), []))
+
+    def test_list_local_objects(self):
+        path = tempfile.mkdtemp()
+        try:
+            for name in ("a/b", "a.txt", "a-b", "c"):
+                filename = os.path.join(path, *name.split("/"))
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                with open(filename, "w") as file:
+                    file.write(name)
+            objects = list(list_local_objects(path, prefix="p/"))
+            eq_(
+                [obj.object_name for obj in objects],
+                ["p/a-b", "p/a.txt", "p/a/b", "p/c"],
+            )
+            eq_([obj.size for obj in objects], [3, 5, 3, 1])
+        finally:
+            shutil.rmtree(path)
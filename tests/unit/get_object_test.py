@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import tempfile
+from datetime import datetime, timezone
 from unittest import TestCase
 
 import mock
@@ -21,7 +24,9 @@ from nose.tools import raises
 
 from minio import Minio
 from minio.api import _DEFAULT_USER_AGENT
-from minio.error import S3Error
+from minio.cache import ContentCache, StatCache
+from minio.datatypes import Object
+from minio.error import InvalidResponseError, S3Error
 
 from .helpers import generate_error
 from .minio_mocks import MockConnection, MockResponse
@@ -56,3 +61,143 @@ class GetObjectTest(TestCase):
         )
         client = Minio('localhost:9000')
         client.get_object('hello', 'key')
+
+    @mock.patch('urllib3.PoolManager')
+    def test_get_object_conditions(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT,
+                          'If-None-Match': '"etag"',
+                          'If-Modified-Since':
+                          'Sun, 09 Feb 2020 07:05:03 GMT'},
+                         304)
+        )
+        client = Minio('localhost:9000')
+        response = client.get_object(
+            'hello', 'key', not_match_etag='etag',
+            modified_since=datetime(2020, 2, 9, 7, 5, 3, tzinfo=timezone.utc),
+        )
+        self.assertEqual(response.status, 304)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_fget_object_not_modified(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT},
+                         200,
+                         response_headers={'ETag': '"abc"',
+                                           'Content-Length': '11'})
+        )
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT,
+                          'If-None-Match': '"abc"'},
+                         304)
+        )
+        path = os.path.join(tempfile.mkdtemp(), 'key')
+        client = Minio('localhost:9000')
+        with self.assertRaises(InvalidResponseError):
+            client.fget_object(
+                'hello', 'key', path,
+                request_headers={'If-None-Match': '"abc"'},
+            )
+        self.assertFalse(os.path.exists(path))
+
+    @mock.patch('urllib3.PoolManager')
+    def test_fget_object_skips_stat_cache(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT},
+                         200,
+                         response_headers={'ETag': '"new"',
+                                           'Content-Length': '4'})
+        )
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT},
+                         200,
+                         content=b'data')
+        )
+        path = os.path.join(tempfile.mkdtemp(), 'key')
+        with open(path + '.old.part.minio', 'wb') as tmp_file:
+            tmp_file.write(b'stale')
+        cache = StatCache()
+        cache.set('hello', 'key', Object('hello', 'key', etag='old', size=20))
+        client = Minio('localhost:9000', stat_cache=cache)
+        stat = client.fget_object('hello', 'key', path)
+        self.assertEqual(stat.etag, 'new')
+        with open(path, 'rb') as data:
+            self.assertEqual(data.read(), b'data')
+
+    @mock.patch('urllib3.PoolManager')
+    def test_get_cached_object(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT},
+                         200,
+                         response_headers={'ETag': '"etag1"'},
+                         content=b'data')
+        )
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT,
+                          'If-None-Match': '"etag1"'},
+                         304)
+        )
+        client = Minio(
+            'localhost:9000', content_cache=ContentCache(tempfile.mkdtemp()),
+        )
+        path = client.get_cached_object('hello', 'key')
+        with open(path, 'rb') as data_file:
+            self.assertEqual(data_file.read(), b'data')
+        self.assertEqual(client.get_cached_object('hello', 'key'), path)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_get_cached_object_evicted(self, mock_connection):
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT,
+                          'If-None-Match': '"etag1"'},
+                         304)
+        )
+        mock_server.mock_add_request(
+            MockResponse('GET',
+                         'https://localhost:9000/hello/key',
+                         {'User-Agent': _DEFAULT_USER_AGENT},
+                         200,
+                         response_headers={'ETag': '"etag1"'},
+                         content=b'data')
+        )
+        cache = ContentCache(tempfile.mkdtemp())
+        path = cache.put('hello', 'key', 'etag1', [b'data'])
+        lookup = cache.get
+
+        def get(*args):
+            # Data file is evicted by another put() right after lookup.
+            result = lookup(*args)
+            os.remove(path)
+            return result
+
+        client = Minio('localhost:9000', content_cache=cache)
+        with mock.patch.object(cache, 'get', side_effect=get):
+            self.assertEqual(client.get_cached_object('hello', 'key'), path)
+        with open(path, 'rb') as data_file:
+            self.assertEqual(data_file.read(), b'data')
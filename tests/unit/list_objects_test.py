@@ -14,13 +14,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import subprocess
+import sys
+from datetime import datetime, timezone
 from unittest import TestCase
+from xml.etree import ElementTree as ET
 
 import mock
-from nose.tools import eq_, timed
+from nose.tools import eq_, raises, timed
 
 from minio import Minio
 from minio.api import _DEFAULT_USER_AGENT
+from minio.datatypes import ListObjectsResult, Object, columns_to_numpy
 
 from .minio_mocks import MockConnection, MockResponse
 
@@ -100,3 +105,337 @@ class ListObjectsTest(TestCase):
             objects.append(obj)
 
         eq_(2, len(objects))
+
+    def test_list_objects_result_chunked(self):
+        mock_data = b'''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <IsTruncated>true</IsTruncated>
+  <Contents><Key>a</Key><Size>1</Size></Contents>
+  <Contents><Key>b</Key><Size>2</Size></Contents>
+  <CommonPrefixes><Prefix>c/</Prefix></CommonPrefixes>
+</ListBucketResult>'''
+        response = mock.Mock()
+        response.stream.return_value = iter(
+            [mock_data[i:i+7] for i in range(0, len(mock_data), 7)],
+        )
+        result = ListObjectsResult(response, "bucket")
+        eq_(
+            [(obj.object_name, obj.size) for obj in result],
+            [("a", 1), ("b", 2), ("c/", None)],
+        )
+        eq_(result.is_truncated, True)
+        eq_(result.continuation_token, "b")
+        response.release_conn.assert_called_once_with()
+        response.close.assert_not_called()
+
+    def test_object_lazy_fields(self):
+        element = ET.fromstring(
+            '<Contents xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+            '<Key>a</Key>'
+            '<LastModified>2016-11-27T07:55:53.000Z</LastModified>'
+            '<ETag>&quot;5d5512301b6b6e247b8aec334b2cf7ea&quot;</ETag>'
+            '<Size>493</Size>'
+            '<Owner><ID>id</ID><DisplayName>name</DisplayName></Owner>'
+            '<UserMetadata><X-Amz-Meta-A>b</X-Amz-Meta-A></UserMetadata>'
+            '</Contents>'
+        )
+        obj = Object.fromxml(element, "bucket")
+        self.assertFalse(hasattr(obj, "__dict__"))
+        eq_(obj.object_name, "a")
+        eq_(
+            obj.last_modified,
+            datetime(2016, 11, 27, 7, 55, 53, tzinfo=timezone.utc),
+        )
+        eq_(obj.etag, "5d5512301b6b6e247b8aec334b2cf7ea")
+        eq_(obj.size, 493)
+        eq_(obj.owner_id, "id")
+        eq_(obj.owner_name, "name")
+        eq_(obj.metadata, {"X-Amz-Meta-A": "b"})
+        eq_(obj.is_delete_marker, False)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_parallel_split_points(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <Prefix></Prefix>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>false</IsTruncated>
+  {0}
+</ListBucketResult>'''
+        contents = '''<Contents>
+    <Key>{0}</Key>
+    <LastModified>2016-11-27T07:55:53.000Z</LastModified>
+    <ETag>&quot;5d5512301b6b6e247b8aec334b2cf7ea&quot;</ETag>
+    <Size>493</Size>
+  </Contents>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    "".join(contents.format(key) for key in "abc"),
+                ).encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=&start-after=b",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(contents.format("c")).encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = client.list_objects_parallel(
+            'bucket', split_points=['b'], num_workers=1,
+        )
+        eq_([obj.object_name for obj in objects], ["a", "b", "c"])
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_parallel_discover(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>false</IsTruncated>
+  {0}
+</ListBucketResult>'''
+        contents = '''<Contents>
+    <Key>{0}</Key>
+    <Size>1</Size>
+  </Contents>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=%2F&list-type=2"
+                "&max-keys=1000&prefix=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    contents.format("a") + contents.format("c") +
+                    "<CommonPrefixes><Prefix>b/</Prefix></CommonPrefixes>",
+                ).encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=b%2F",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    contents.format("b/1") + contents.format("b/2"),
+                ).encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = client.list_objects_parallel('bucket', num_workers=1)
+        eq_(
+            [obj.object_name for obj in objects],
+            ["a", "b/1", "b/2", "c"],
+        )
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_prefetch(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <MaxKeys>1000</MaxKeys>
+  <IsTruncated>{0}</IsTruncated>
+  {1}
+  <Contents>
+    <Key>{2}</Key>
+    <Size>1</Size>
+  </Contents>
+</ListBucketResult>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    "true",
+                    "<NextContinuationToken>token</NextContinuationToken>",
+                    "a",
+                ).encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?continuation-token=token"
+                "&delimiter=&list-type=2&max-keys=1000&prefix="
+                "&start-after=token",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format("false", "", "b").encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        objects = client.list_objects(
+            'bucket', recursive=True, prefetch_pages=1,
+        )
+        eq_([obj.object_name for obj in objects], ["a", "b"])
+
+    @raises(ValueError)
+    def test_list_objects_negative_prefetch(self):
+        client = Minio('localhost:9000')
+        client.list_objects('bucket', prefetch_pages=-1)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_list_objects_columnar(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListVersionsResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <IsTruncated>false</IsTruncated>
+  <Version>
+    <Key>a</Key>
+    <VersionId>v2</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2020-01-02T00:00:00.000Z</LastModified>
+    <ETag>&quot;etag2&quot;</ETag>
+    <Size>20</Size>
+  </Version>
+  <DeleteMarker>
+    <Key>b</Key>
+    <VersionId>v1</VersionId>
+    <IsLatest>true</IsLatest>
+    <LastModified>2020-01-01T00:00:00.000Z</LastModified>
+  </DeleteMarker>
+</ListVersionsResult>'''
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&max-keys=1000"
+                "&prefix=&versions=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        batches = list(
+            client.list_objects_columnar(
+                'bucket', recursive=True, include_version=True,
+            ),
+        )
+        eq_(len(batches), 1)
+        batch = batches[0]
+        eq_(batch["object_name"], ["a", "b"])
+        eq_(batch["size"], [20, None])
+        eq_(batch["etag"], ["etag2", None])
+        eq_(batch["version_id"], ["v2", "v1"])
+        eq_(batch["is_latest"], [True, True])
+        eq_(batch["is_delete_marker"], [False, True])
+        eq_(
+            batch["last_modified"],
+            [datetime(2020, 1, 2, tzinfo=timezone.utc),
+             datetime(2020, 1, 1, tzinfo=timezone.utc)],
+        )
+
+    @raises(ValueError)
+    def test_list_objects_columnar_negative_prefetch(self):
+        client = Minio('localhost:9000')
+        client.list_objects_columnar('bucket', prefetch_pages=-1)
+
+    def test_columns_to_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        array = columns_to_numpy({
+            "object_name": ["a", "b"],
+            "size": [20, None],
+            "last_modified": [datetime(2020, 1, 2, tzinfo=timezone.utc),
+                              None],
+            "etag": ["etag2", None],
+            "version_id": [None, "v1"],
+            "is_latest": [True, False],
+            "is_delete_marker": [False, True],
+        })
+        eq_(list(array["object_name"]), ["a", "b"])
+        eq_(list(array["size"]), [20, -1])
+        eq_(str(array["last_modified"][0]), "2020-01-02T00:00:00.000")
+        eq_(bool(numpy.isnat(array["last_modified"][1])), True)
+        eq_(list(array["is_delete_marker"]), [False, True])
+
+    def test_numpy_not_imported(self):
+        output = subprocess.check_output([
+            sys.executable, "-c",
+            "import sys, minio; print('numpy' in sys.modules)",
+        ])
+        eq_(output.strip(), b"False")
+
+    @mock.patch('urllib3.PoolManager')
+    def test_prefix_usage(self, mock_connection):
+        mock_data = '''<?xml version="1.0" encoding="UTF-8"?>
+<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">
+  <Name>bucket</Name>
+  <IsTruncated>false</IsTruncated>
+  {0}
+</ListBucketResult>'''
+        contents = "<Contents><Key>{0}</Key><Size>{1}</Size></Contents>"
+        prefixes = "<CommonPrefixes><Prefix>{0}</Prefix></CommonPrefixes>"
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=%2F&list-type=2"
+                "&max-keys=1000&prefix=",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    contents.format("x", 5) + prefixes.format("a/") +
+                    prefixes.format("b/"),
+                ).encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=a%2F",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format(
+                    contents.format("a/1", 10) + contents.format("a/2/3", 20),
+                ).encode(),
+            ),
+        )
+        mock_server.mock_add_request(
+            MockResponse(
+                "GET",
+                "https://localhost:9000/bucket?delimiter=&list-type=2"
+                "&max-keys=1000&prefix=b%2F",
+                {"User-Agent": _DEFAULT_USER_AGENT},
+                200,
+                content=mock_data.format("").encode(),
+            ),
+        )
+        client = Minio('localhost:9000')
+        eq_(
+            [
+                (usage.prefix, usage.object_count, usage.size)
+                for usage in client.prefix_usage('bucket', num_workers=1)
+            ],
+            [("", 1, 5), ("a/", 2, 30), ("b/", 0, 0)],
+        )
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timezone
+from unittest import TestCase
+
+import mock
+from nose.tools import eq_
+
+from minio.datatypes import Object
+from minio.listindex import ListingIndex
+
+
+def _object(name, size, day):
+    return Object(
+        "bucket", name, size=size, etag="etag-" + name,
+        last_modified=datetime(2020, 1, day, tzinfo=timezone.utc),
+    )
+
+
+def _names(objects):
+    return [obj.object_name for obj in objects]
+
+
+class ListingIndexTest(TestCase):
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.list_objects.return_value = [
+            _object("a/1", 10, 1),
+            _object("a/2", 2000, 5),
+            _object("b/1", 30, 10),
+        ]
+        self.index = ListingIndex(self.client, "bucket")
+        eq_(self.index.rescan(), 3)
+
+    def test_query(self):
+        eq_(_names(self.index.query()), ["a/1", "a/2", "b/1"])
+        eq_(_names(self.index.query(prefix="a/")), ["a/1", "a/2"])
+        eq_(_names(self.index.query(min_size=20, max_size=100)), ["b/1"])
+        eq_(
+            _names(
+                self.index.query(
+                    modified_after=datetime(2020, 1, 3, tzinfo=timezone.utc),
+                ),
+            ),
+            ["a/2", "b/1"],
+        )
+        obj = self.index.query(prefix="b/")[0]
+        eq_(obj.size, 30)
+        eq_(obj.etag, "etag-b/1")
+        eq_(obj.last_modified, datetime(2020, 1, 10, tzinfo=timezone.utc))
+
+    def test_rescan_removes_missing(self):
+        self.client.list_objects.return_value = [_object("a/3", 1, 2)]
+        eq_(self.index.rescan(prefix="a/"), 1)
+        self.client.list_objects.assert_called_with(
+            "bucket", prefix="a/", recursive=True, start_after=None,
+        )
+        eq_(_names(self.index.query()), ["a/3", "b/1"])
+
+        self.client.list_objects.return_value = []
+        self.index.rescan(start_after="a/3")
+        eq_(_names(self.index.query()), ["a/3"])
+
+    def test_apply_event(self):
+        record = {
+            "eventName": "s3:ObjectCreated:Put",
+            "eventTime": "2020-01-20T00:00:00.000Z",
+            "s3": {
+                "bucket": {"name": "bucket"},
+                "object": {"key": "c/my+file", "size": 5, "eTag": "abc"},
+            },
+        }
+        eq_(self.index.apply_event(record), True)
+        obj = self.index.query(prefix="c/")[0]
+        eq_(obj.object_name, "c/my file")
+        eq_(obj.size, 5)
+
+        record["eventName"] = "s3:ObjectRemoved:Delete"
+        record["s3"]["object"]["key"] = "a/1"
+        eq_(self.index.apply_event(record), True)
+        eq_(_names(self.index.query()), ["a/2", "b/1", "c/my file"])
+
+        record["s3"]["bucket"]["name"] = "other"
+        eq_(self.index.apply_event(record), False)
+
+    def test_listen(self):
+        self.client.listen_bucket_notification.return_value = iter([
+            {"Records": [{
+                "eventName": "s3:ObjectRemoved:Delete",
+                "s3": {
+                    "bucket": {"name": "bucket"},
+                    "object": {"key": "b/1"},
+                },
+            }]},
+        ])
+        eq_(len(list(self.index.listen())), 1)
+        eq_(_names(self.index.query()), ["a/1", "a/2"])
@@ -50,15 +50,20 @@ class MockResponse(object):
             eq_(self.request_headers[header], headers[header])
 
     # noinspection PyUnusedLocal
-    def stream(self, chunk_size=1, decode_unicode=False):
-        if self.data is not None:
-            return iter(bytearray(self.data, 'utf-8'))
-        return iter([])
+    def stream(self, amt=2**16, decode_content=None):
+        data = self.data or b''
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return iter([data[i:i+amt] for i in range(0, len(data), amt)])
 
     # dummy release connection call.
     def release_conn(self):
         return
 
+    # dummy close call.
+    def close(self):
+        return
+
     def getheader(self, key, value=None):
         return self.headers.get(key, value) if self.headers else value
 
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from unittest import TestCase
 from urllib.parse import urlunsplit
 
@@ -22,7 +23,7 @@ from nose.tools import eq_, raises
 from minio import Minio
 from minio import __version__ as minio_version
 from minio.api import _DEFAULT_USER_AGENT
-from minio.helpers import BaseURL, check_bucket_name
+from minio.helpers import BaseURL, check_bucket_name, iterate_parallel
 
 
 class ValidBucketName(TestCase):
@@ -171,3 +172,27 @@ class GetRegionTests(TestCase):
     @raises(ValueError)
     def test_invalid_value(self):
         BaseURL(None, None)
+
+
+class IterateParallelTest(TestCase):
+    def test_ordered(self):
+        def task(index):
+            time.sleep(0.01 * (5 - index))
+            return [index * 10, index * 10 + 1]
+
+        tasks = (lambda index=index: task(index) for index in range(5))
+        eq_(
+            list(iterate_parallel(tasks, 3, ordered=True)),
+            [0, 1, 10, 11, 20, 21, 30, 31, 40, 41],
+        )
+
+    def test_unordered(self):
+        tasks = [lambda index=index: [index] for index in range(10)]
+        eq_(sorted(iterate_parallel(tasks, 4)), list(range(10)))
+
+    @raises(ValueError)
+    def test_error(self):
+        def fail():
+            raise ValueError("failed")
+
+        list(iterate_parallel([lambda: [1], fail, lambda: [2]], 2))
@@ -21,7 +21,8 @@ import mock
 
 from minio import Minio
 from minio.api import _DEFAULT_USER_AGENT
-from minio.deleteobjects import DeleteObject
+from minio.datatypes import Object
+from minio.deleteobjects import DeleteError, DeleteObject, DeleteResult
 
 from .minio_mocks import MockConnection, MockResponse
 
@@ -78,3 +79,63 @@ class RemoveObjectsTest(TestCase):
         it = itertools.chain((DeleteObject("Ab"), DeleteObject("c")))
         for err in client.remove_objects('hello', it):
             print(err)
+
+    def test_parallel_deletes(self):
+        batches = []
+
+        def delete_objects(bucket_name, objects, **kwargs):
+            batches.append(len(objects))
+            return DeleteResult(
+                [], [DeleteError("AccessDenied", "denied", "name", None)],
+            )
+
+        client = Minio('localhost:9000')
+        with mock.patch.object(
+                client, "_delete_objects", side_effect=delete_objects,
+        ):
+            errors = client.remove_objects(
+                "hello",
+                (DeleteObject(str(i)) for i in range(2500)),
+                num_parallel_deletes=3,
+            )
+            self.assertEqual(
+                [error.code for error in errors], ["AccessDenied"] * 3,
+            )
+        self.assertEqual(sorted(batches), [500, 1000, 1000])
+
+    def test_remove_prefix(self):
+        listed = [
+            Object("hello", "p/{0}".format(i), size=1, version_id="v")
+            for i in range(1500)
+        ]
+
+        def delete_objects(bucket_name, objects, **kwargs):
+            errors = []
+            if len(objects) == 1000:
+                errors.append(DeleteError("Denied", "denied", "p/0", None))
+            return DeleteResult([], errors)
+
+        progress = mock.Mock()
+        client = Minio('localhost:9000')
+        with mock.patch.object(
+                client, "_list_objects", return_value=iter(listed),
+        ) as list_objects, mock.patch.object(
+            client, "_delete_objects", side_effect=delete_objects,
+        ):
+            errors = list(
+                client.remove_prefix(
+                    "hello", "p/", num_parallel_deletes=1, progress=progress,
+                ),
+            )
+        list_objects.assert_called_once_with(
+            "hello", prefix="p/", include_version=False, prefetch_pages=2,
+        )
+        self.assertEqual([error.name for error in errors], ["p/0"])
+        self.assertEqual(
+            progress.call_args_list, [mock.call(999, 1), mock.call(1499, 1)],
+        )
+
+    def test_remove_prefix_negative_prefetch(self):
+        client = Minio("localhost:9000")
+        with self.assertRaises(ValueError):
+            list(client.remove_prefix("hello", "p/", prefetch_pages=-1))
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import struct
+from binascii import crc32
+from unittest import TestCase
+
+import mock
+from nose.tools import eq_, raises
+
+from minio import Minio
+from minio.datatypes import Object
+from minio.select import (SelectCRCValidationError, SelectMessageError,
+                          SelectObjectReader, byte_int)
+from minio.selectrequest import (COMPRESSION_TYPE_GZIP, CSVInputSerialization,
+                                 CSVOutputSerialization,
+                                 JSONOutputSerialization, SelectRequest)
+from minio.xml import marshal
+
+
+def _header(name, value):
+    name = name.encode()
+    value = value.encode()
+    return (
+        struct.pack(">B", len(name)) + name +
+        struct.pack(">BH", 7, len(value)) + value
+    )
+
+
+def _message(event_type, payload=b"", content_type=None):
+    headers = _header(":message-type", "event")
+    headers += _header(":event-type", event_type)
+    if content_type:
+        headers += _header(":content-type", content_type)
+    prelude = struct.pack(
+        ">II", len(headers) + len(payload) + 16, len(headers),
+    )
+    prelude += struct.pack(">I", crc32(prelude))
+    message = prelude + headers + payload
+    return message + struct.pack(">I", crc32(message))
+
+
+def _error_message(code, message):
+    headers = _header(":message-type", "error")
+    headers += _header(":error-code", code)
+    headers += _header(":error-message", message)
+    prelude = struct.pack(">II", len(headers) + 16, len(headers))
+    prelude += struct.pack(">I", crc32(prelude))
+    data = prelude + headers
+    return data + struct.pack(">I", crc32(data))
+
+
+_STATS = (
+    b"<Stats><BytesScanned>100</BytesScanned>"
+    b"<BytesProcessed>100</BytesProcessed>"
+    b"<BytesReturned>10</BytesReturned></Stats>"
+)
+
+_PROGRESS = (
+    b"<Progress><BytesScanned>50</BytesScanned>"
+    b"<BytesProcessed>50</BytesProcessed>"
+    b"<BytesReturned>0</BytesReturned></Progress>"
+)
+
+
+class _Response(io.BytesIO):
+    """Response returning at most 7 bytes per read."""
+
+    def readinto(self, buffer):
+        return super().readinto(memoryview(buffer)[:7])
+
+    def isclosed(self):
+        return self.closed
+
+
+class SelectObjectReaderTest(TestCase):
+    def test_stream(self):
+        reader = SelectObjectReader(_Response(
+            _message("Cont") +
+            _message("Records", b"a,b\n") +
+            _message("Progress", b"<Progress></Progress>", "text/xml") +
+            _message("Records", b"c,d\ne,f\n") +
+            _message("Stats", _STATS, "text/xml") +
+            _message("End")
+        ))
+        eq_(list(reader.stream(5)), ["a,b\n", "c,d\ne", ",f\n"])
+        eq_(
+            reader.stats(),
+            {"BytesScanned": "100", "BytesProcessed": "100",
+             "BytesReturned": "10"},
+        )
+
+    def test_progress(self):
+        events = []
+        reader = SelectObjectReader(
+            _Response(
+                _message("Progress", _PROGRESS, "text/xml") +
+                _message("Records", b"a,b\n") +
+                _message("Stats", _STATS, "text/xml") +
+                _message("End")
+            ),
+            progress=lambda *args: events.append(args),
+        )
+        eq_(list(reader.stream()), ["a,b\n"])
+        progress = {"BytesScanned": "50", "BytesProcessed": "50",
+                    "BytesReturned": "0"}
+        eq_(reader.progress(), progress)
+        eq_(events, [("Progress", progress), ("Stats", reader.stats())])
+
+    def test_progress_cancel(self):
+        def progress(event_type, info):
+            raise ValueError("cancelled")
+
+        response = _Response(
+            _message("Progress", _PROGRESS, "text/xml") +
+            _message("Records", b"a,b\n") +
+            _message("End")
+        )
+        reader = SelectObjectReader(response, progress=progress)
+        with self.assertRaises(ValueError):
+            list(reader.stream())
+        assert response.closed
+
+    def test_stream_split_character(self):
+        reader = SelectObjectReader(_Response(
+            _message("Records", "a\u00e9\u20ac".encode()) +
+            _message("Records", b"\xf0\x9f") +
+            _message("Records", b"\x98\x80\n") +
+            _message("End")
+        ))
+        eq_(
+            list(reader.stream(2)),
+            ["a", "\u00e9", "\u20ac", "\U0001f600", "\n"],
+        )
+
+    def test_stream_bytes(self):
+        reader = SelectObjectReader(_Response(
+            _message("Records", b"a,\xff\n") +
+            _message("Records", b"c,d\n") +
+            _message("End")
+        ))
+        eq_(
+            list(reader.stream_bytes(3)),
+            [b"a,\xff", b"\n", b"c,d", b"\n"],
+        )
+
+    def test_stream_large_message(self):
+        records = b"x" * (200*1024)
+        reader = SelectObjectReader(_Response(
+            _message("Records", records) + _message("End"),
+        ))
+        eq_("".join(reader.stream()).encode(), records)
+
+    def test_stream_without_end(self):
+        reader = SelectObjectReader(
+            _Response(_message("Records", b"a,b\n")),
+        )
+        eq_(list(reader.stream()), ["a,b\n"])
+
+    @raises(SelectMessageError)
+    def test_error_message(self):
+        reader = SelectObjectReader(_Response(
+            _message("Records", b"a,b\n") +
+            _error_message("InternalError", "error")
+        ))
+        list(reader.stream())
+
+    @raises(SelectCRCValidationError)
+    def test_message_crc_mismatch(self):
+        data = bytearray(_message("Records", b"a,b\n"))
+        data[-5] ^= 0xff
+        list(SelectObjectReader(_Response(bytes(data))).stream())
+
+    @raises(SelectCRCValidationError)
+    def test_prelude_crc_mismatch(self):
+        data = bytearray(_message("Records", b"a,b\n"))
+        data[11] ^= 0xff
+        list(SelectObjectReader(_Response(bytes(data))).stream())
+
+    @raises(SelectMessageError)
+    def test_truncated_message(self):
+        data = _message("Records", b"a,b\n")
+        list(SelectObjectReader(_Response(data[:-2])).stream())
+
+    def test_csv_records(self):
+        reader = SelectObjectReader(
+            _Response(
+                _message("Records", b'a,"b\nc",d\ne,') +
+                _message("Records", b'"f"",g",h\ni') +
+                _message("Records", b",j") +
+                _message("End")
+            ),
+            CSVOutputSerialization(),
+        )
+        eq_(
+            list(reader.records(4)),
+            [("a", "b\nc", "d"), ("e", 'f",g', "h"), ("i", "j")],
+        )
+
+    def test_csv_records_delimiters(self):
+        reader = SelectObjectReader(
+            _Response(_message("Records", b"a|'b;c'|d;e|f;") +
+                      _message("End")),
+            CSVOutputSerialization(
+                field_delimiter="|", quote_character="'",
+                record_delimiter=";",
+            ),
+        )
+        eq_(list(reader.records()), [("a", "b;c", "d"), ("e", "f")])
+
+    def test_csv_records_escape_character(self):
+        reader = SelectObjectReader(
+            _Response(
+                _message("Records", b'1,"a\\"b"\n2,c\n3,"d\\"') +
+                _message("Records", b'\ne"\n') +
+                _message("End")
+            ),
+            CSVOutputSerialization(quote_escape_character="\\"),
+        )
+        eq_(
+            list(reader.records()),
+            [("1", 'a"b'), ("2", "c"), ("3", 'd"\ne')],
+        )
+
+    def test_json_records(self):
+        reader = SelectObjectReader(
+            _Response(
+                _message("Records", b'{"a":1,"b":"x,y"},{"a"') +
+                _message("Records", b':2},') +
+                _message("End")
+            ),
+            JSONOutputSerialization(record_delimiter=","),
+        )
+        eq_(list(reader.records()), [{"a": 1, "b": "x,y"}, {"a": 2}])
+
+    def test_record_batches(self):
+        data = (
+            _message("Records", b'{"a":1}\n{"a":2,"b":3}\n{"b":4}\n') +
+            _message("End")
+        )
+        reader = SelectObjectReader(
+            _Response(data), JSONOutputSerialization(),
+        )
+        eq_(
+            list(reader.record_batches(2)),
+            [[{"a": 1}, {"a": 2, "b": 3}], [{"b": 4}]],
+        )
+        reader = SelectObjectReader(
+            _Response(data), JSONOutputSerialization(),
+        )
+        eq_(
+            list(reader.record_batches(2, columnar=True)),
+            [{"a": [1, 2], "b": [None, 3]}, {"b": [4]}],
+        )
+        reader = SelectObjectReader(
+            _Response(_message("Records", b"1,2\n3,4\n5\n") +
+                      _message("End")),
+            CSVOutputSerialization(),
+        )
+        eq_(
+            list(reader.record_batches(3, columnar=True)),
+            [[["1", "3", "5"], ["2", "4", None]]],
+        )
+
+    @raises(ValueError)
+    def test_records_without_serialization(self):
+        SelectObjectReader(_Response(b"")).records()
+
+    def test_byte_int(self):
+        eq_(byte_int(b"\x00\x01\x00\x00"), 65536)
+        eq_(byte_int(b"\xff"), 255)
+
+
+def _select(bucket_name, object_name, request, progress=None):
+    start = request.scan_start_range
+    end = request.scan_end_range
+    return SelectObjectReader(
+        _Response(
+            _message(
+                "Records",
+                "".join(
+                    "{0}\n".format(i) for i in range(start, end + 1)
+                ).encode(),
+            ) +
+            _message("Stats", _STATS, "text/xml") +
+            _message("End")
+        ),
+        request.output_serialization,
+        progress,
+    )
+
+
+class SelectObjectContentParallelTest(TestCase):
+    def _request(self, **kwargs):
+        return SelectRequest(
+            "select * from s3object",
+            CSVInputSerialization(**kwargs),
+            CSVOutputSerialization(),
+        )
+
+    def test_scan_ranges(self):
+        client = Minio("localhost:9000")
+        with mock.patch.object(
+                client, "stat_object",
+                return_value=Object("bucket", "object", size=10),
+        ), mock.patch.object(
+            client, "select_object_content", side_effect=_select,
+        ) as select:
+            data = client.select_object_content_parallel(
+                "bucket", "object", self._request(), num_workers=2,
+                part_size=4,
+            )
+            eq_(
+                list(data.records()),
+                [(str(i),) for i in range(10)],
+            )
+        eq_(
+            [(call[0][2].scan_start_range, call[0][2].scan_end_range)
+             for call in select.call_args_list],
+            [(0, 3), (4, 7), (8, 9)],
+        )
+        eq_(
+            data.stats(),
+            {"BytesScanned": "300", "BytesProcessed": "300",
+             "BytesReturned": "30"},
+        )
+
+    def test_empty_object(self):
+        def select(bucket_name, object_name, request, progress=None):
+            eq_(request.scan_start_range, None)
+            eq_(request.scan_end_range, None)
+            return SelectObjectReader(
+                _Response(_message("Stats", _STATS, "text/xml") +
+                          _message("End")),
+                request.output_serialization,
+                progress,
+            )
+
+        client = Minio("localhost:9000")
+        with mock.patch.object(
+                client, "stat_object",
+                return_value=Object("bucket", "object", size=0),
+        ), mock.patch.object(
+            client, "select_object_content", side_effect=select,
+        ) as select_object_content:
+            data = client.select_object_content_parallel(
+                "bucket", "object", self._request(),
+            )
+            eq_(list(data.keyed_records()), [])
+        eq_(select_object_content.call_count, 1)
+        eq_(
+            data.stats(),
+            {"BytesScanned": "100", "BytesProcessed": "100",
+             "BytesReturned": "10"},
+        )
+
+    def test_scan_range_xml(self):
+        body = marshal(SelectRequest(
+            "select * from s3object",
+            CSVInputSerialization(),
+            CSVOutputSerialization(),
+            scan_start_range=0,
+            scan_end_range=99,
+        ))
+        assert b"<ScanRange><Start>0</Start><End>99</End></ScanRange>" in body
+
+    @raises(ValueError)
+    def test_compressed_input(self):
+        Minio("localhost:9000").select_object_content_parallel(
+            "bucket", "object",
+            self._request(compression_type=COMPRESSION_TYPE_GZIP),
+        )
+
+
+class SelectPrefixTest(TestCase):
+    def test_select_prefix(self):
+        def select(bucket_name, object_name, request, progress=None):
+            return SelectObjectReader(
+                _Response(
+                    _message("Progress", _PROGRESS, "text/xml") +
+                    _message("Records", object_name.encode() + b",1\n") +
+                    _message("Stats", _STATS, "text/xml") +
+                    _message("End")
+                ),
+                request.output_serialization,
+                progress,
+            )
+
+        client = Minio("localhost:9000")
+        objects = [
+            Object("bucket", "data/a.csv"),
+            Object("bucket", "data/b.json"),
+            Object("bucket", "data/c/"),
+            Object("bucket", "data/d.csv"),
+        ]
+        with mock.patch.object(
+                client, "list_objects", return_value=iter(objects),
+        ) as list_objects, mock.patch.object(
+            client, "select_object_content", side_effect=select,
+        ):
+            events = []
+            data = client.select_prefix(
+                "bucket", "data/",
+                SelectRequest(
+                    "select * from s3object",
+                    CSVInputSerialization(),
+                    CSVOutputSerialization(),
+                ),
+                suffix=".csv", num_workers=1, ordered=True,
+                progress=lambda *args: events.append(args),
+            )
+            eq_(
+                list(data.keyed_records()),
+                [("data/a.csv", ("data/a.csv", "1")),
+                 ("data/d.csv", ("data/d.csv", "1"))],
+            )
+        list_objects.assert_called_once_with(
+            "bucket", "data/", recursive=True,
+        )
+        eq_(
+            data.stats(),
+            {"BytesScanned": "200", "BytesProcessed": "200",
+             "BytesReturned": "20"},
+        )
+        eq_(data.progress(), data.stats())
+        eq_(
+            events,
+            [("Progress", {"BytesScanned": "50", "BytesProcessed": "50",
+                           "BytesReturned": "0"}),
+             ("Stats", {"BytesScanned": "100", "BytesProcessed": "100",
+                        "BytesReturned": "10"}),
+             ("Progress", {"BytesScanned": "150", "BytesProcessed": "150",
+                           "BytesReturned": "10"}),
+             ("Stats", {"BytesScanned": "200", "BytesProcessed": "200",
+                        "BytesReturned": "20"})],
+        )
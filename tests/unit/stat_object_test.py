@@ -17,10 +17,12 @@
 from unittest import TestCase
 
 import mock
+import urllib3
 from nose.tools import raises
 
 from minio import Minio
 from minio.api import _DEFAULT_USER_AGENT
+from minio.cache import StatCache
 
 from .minio_mocks import MockConnection, MockResponse
 
@@ -59,3 +61,118 @@ class StatObject(TestCase):
         )
         client = Minio('localhost:9000')
         client.stat_object('hello', 'world')
+
+    @mock.patch('urllib3.PoolManager')
+    def test_stat_objects(self, mock_connection):
+        mock_headers = {
+            'content-type': 'application/octet-stream',
+            'last-modified': 'Fri, 26 Jun 2015 19:05:37 GMT',
+            'content-length': 11,
+            'etag': '5eb63bbbe01eeed093cb22bb8f5acdc3'
+        }
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 200,
+                         response_headers=mock_headers)
+        )
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/missing?versionId=v1',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 404)
+        )
+        client = Minio('localhost:9000')
+        results = list(
+            client.stat_objects(
+                'hello', ['world', ('missing', 'v1')], num_workers=1,
+                ordered=True,
+            ),
+        )
+        self.assertEqual(
+            [(result.object_name, result.version_id) for result in results],
+            [('world', None), ('missing', 'v1')],
+        )
+        self.assertEqual(results[0].object.size, 11)
+        self.assertEqual(results[0].error, None)
+        self.assertEqual(results[1].object, None)
+        self.assertEqual(results[1].error.code, 'NoSuchKey')
+
+    @mock.patch('urllib3.PoolManager')
+    def test_stat_objects_connection_error(self, mock_connection):
+        error = urllib3.exceptions.MaxRetryError(None, '/hello/broken')
+
+        def _stat_object(bucket_name, object_name, **kwargs):
+            if object_name == 'broken':
+                raise error
+            return stat_object(bucket_name, object_name, **kwargs)
+
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 200,
+                         response_headers={'content-length': 11})
+        )
+        client = Minio('localhost:9000')
+        stat_object = client.stat_object
+        with mock.patch.object(client, 'stat_object',
+                               side_effect=_stat_object):
+            results = list(
+                client.stat_objects(
+                    'hello', ['broken', 'world'], num_workers=1,
+                    ordered=True,
+                ),
+            )
+        self.assertEqual(results[0].object, None)
+        self.assertIs(results[0].error, error)
+        self.assertEqual(results[1].object.size, 11)
+        self.assertEqual(results[1].error, None)
+
+    @mock.patch('urllib3.PoolManager')
+    def test_stat_cache(self, mock_connection):
+        mock_headers = {
+            'content-length': 11,
+            'etag': '"5eb63bbbe01eeed093cb22bb8f5acdc3"',
+        }
+        mock_server = MockConnection()
+        mock_connection.return_value = mock_server
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 200,
+                         response_headers=mock_headers)
+        )
+        mock_server.mock_add_request(
+            MockResponse('DELETE',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 204)
+        )
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT}, 200,
+                         response_headers=mock_headers)
+        )
+        mock_server.mock_add_request(
+            MockResponse('HEAD',
+                         'https://localhost:9000/hello/world',
+                         {'User-Agent': _DEFAULT_USER_AGENT,
+                          'If-None-Match':
+                          '"5eb63bbbe01eeed093cb22bb8f5acdc3"'},
+                         304)
+        )
+        client = Minio(
+            'localhost:9000', stat_cache=StatCache(ttl=10, revalidate=True),
+        )
+        with mock.patch("time.time", return_value=1000.0):
+            obj = client.stat_object('hello', 'world')
+            self.assertIs(client.stat_object('hello', 'world'), obj)
+            client.remove_object('hello', 'world')
+            obj = client.stat_object('hello', 'world')
+        with mock.patch("time.time", return_value=1020.0):
+            self.assertIs(client.stat_object('hello', 'world'), obj)
+            self.assertIs(client.stat_object('hello', 'world'), obj)
+        self.assertEqual(obj.size, 11)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# MinIO Python Library for Amazon S3 Compatible Cloud Storage,
+# (C) 2020 MinIO, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from nose.tools import eq_, raises
+
+from minio.time import (from_http_header, from_iso8601utc, to_amz_date,
+                        to_http_header, to_iso8601utc, to_signer_date)
+
+
+class TimeTest(TestCase):
+    def test_from_iso8601utc(self):
+        eq_(
+            from_iso8601utc("2016-11-27T07:55:53.123Z"),
+            datetime(2016, 11, 27, 7, 55, 53, 123000, timezone.utc),
+        )
+        eq_(
+            from_iso8601utc("2016-11-27T07:55:53.123456Z"),
+            datetime(2016, 11, 27, 7, 55, 53, 123456, timezone.utc),
+        )
+        eq_(
+            from_iso8601utc("2016-11-27T07:55:53Z"),
+            datetime(2016, 11, 27, 7, 55, 53, tzinfo=timezone.utc),
+        )
+        eq_(from_iso8601utc(None), None)
+
+    @raises(ValueError)
+    def test_from_iso8601utc_invalid(self):
+        from_iso8601utc("2016-13-27T07:55:53.000Z")
+
+    def test_to_iso8601utc(self):
+        eq_(
+            to_iso8601utc(datetime(2016, 11, 27, 7, 55, 53, 123456)),
+            "2016-11-27T07:55:53.123Z",
+        )
+        eq_(
+            to_iso8601utc(
+                datetime(2016, 11, 27, 9, 55, 53,
+                         tzinfo=timezone(timedelta(hours=2))),
+            ),
+            "2016-11-27T07:55:53.000Z",
+        )
+
+    def test_http_header(self):
+        value = datetime(2020, 2, 9, 7, 5, 3, tzinfo=timezone.utc)
+        eq_(to_http_header(value), "Sun, 09 Feb 2020 07:05:03 GMT")
+        eq_(from_http_header("Sun, 09 Feb 2020 07:05:03 GMT"), value)
+
+    @raises(ValueError)
+    def test_from_http_header_invalid(self):
+        from_http_header("Sun, 09 Foo 2020 07:05:03 GMT")
+
+    def test_from_http_header_lenient(self):
+        value = datetime(2020, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        eq_(from_http_header("Wed, 1 Jan 2020 00:00:00 GMT"), value)
+        eq_(from_http_header("wed, 01 jan 2020 00:00:00 GMT"), value)
+        eq_(from_http_header("WED, 01 JAN 2020 0:0:0 GMT"), value)
+
+    def test_from_http_header_invalid_fields(self):
+        for value in (
+                "Sun, +9 Feb 2020 07:05:03 GMT",
+                "Sun,  9 Feb 2020 07:05:+3 GMT",
+                "Sun, 09 Feb  020 07:05:03 GMT",
+                "Sun, 09 Feb 2020 07:05:03 +0000",
+                "Sun, 30 Feb 2020 07:05:03 GMT",
+                "Sun 09 Feb 2020 07:05:03 GMT",
+        ):
+            self.assertRaises(ValueError, from_http_header, value)
+
+    def test_amz_date(self):
+        value = datetime(2020, 2, 9, 7, 5, 3, tzinfo=timezone.utc)
+        eq_(to_amz_date(value), "20200209T070503Z")
+        eq_(to_signer_date(value), "20200209")